@@ -0,0 +1,41 @@
+"""Store job description embeddings as pgvector
+
+Revision ID: job_embedding_pgvector
+Revises: add_kundali
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = 'job_embedding_pgvector'
+down_revision = 'add_kundali'
+branch_labels = None
+depends_on = None
+
+# Same setting the JobDescription.embedding column is declared with
+EMBEDDING_DIMENSION = settings.EMBEDDING_DIMENSION
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    # Embeddings with a different dimension cannot be cast and are regenerated on reprocessing
+    op.execute(
+        f"""
+        ALTER TABLE job_descriptions
+        ALTER COLUMN embedding TYPE vector({EMBEDDING_DIMENSION})
+        USING CASE
+            WHEN json_array_length(embedding) = {EMBEDDING_DIMENSION} THEN embedding::text::vector
+            ELSE NULL
+        END
+        """
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE job_descriptions ALTER COLUMN embedding TYPE json "
+        "USING embedding::text::json"
+    )
@@ -0,0 +1,26 @@
+"""Store resume_versions.parsed_data as jsonb
+
+Revision ID: resume_parsed_data_jsonb
+Revises: resume_version_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'resume_parsed_data_jsonb'
+down_revision = 'resume_version_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE resume_versions ALTER COLUMN parsed_data TYPE jsonb USING parsed_data::jsonb"
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE resume_versions ALTER COLUMN parsed_data TYPE json USING parsed_data::json"
+    )
@@ -0,0 +1,33 @@
+"""Replace the (resume_id, is_current) index with a partial index on current versions
+
+Revision ID: resume_version_current_partial
+Revises: resume_parsed_data_jsonb
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'resume_version_current_partial'
+down_revision = 'resume_parsed_data_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_resume_versions_current "
+            "ON resume_versions (resume_id) WHERE is_current"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_resume_versions_resume_current")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_resume_versions_resume_current "
+            "ON resume_versions (resume_id, is_current)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_resume_versions_current")
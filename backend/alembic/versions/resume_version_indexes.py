@@ -0,0 +1,31 @@
+"""Add composite indexes on resume_versions for resume processing lookups
+
+Revision ID: resume_version_indexes
+Revises: job_embedding_pgvector
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'resume_version_indexes'
+down_revision = 'job_embedding_pgvector'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # candidates.resume_id and candidate_kundalis.candidate_id are already unique-indexed
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_resume_versions_resume_current "
+        "ON resume_versions (resume_id, is_current)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_resume_versions_resume_version "
+        "ON resume_versions (resume_id, version_number)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_resume_versions_resume_version")
+    op.execute("DROP INDEX IF EXISTS ix_resume_versions_resume_current")
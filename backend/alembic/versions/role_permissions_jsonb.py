@@ -0,0 +1,34 @@
+"""Store roles.permissions as jsonb with a GIN index
+
+Revision ID: role_permissions_jsonb
+Revises: resume_version_current_partial
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'role_permissions_jsonb'
+down_revision = 'resume_version_current_partial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("UPDATE roles SET permissions = '[]' WHERE permissions IS NULL")
+    op.execute(
+        "ALTER TABLE roles ALTER COLUMN permissions TYPE jsonb USING permissions::jsonb"
+    )
+    op.execute("ALTER TABLE roles ALTER COLUMN permissions SET NOT NULL")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_roles_permissions_gin "
+        "ON roles USING gin (permissions jsonb_path_ops)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_roles_permissions_gin")
+    op.execute("ALTER TABLE roles ALTER COLUMN permissions DROP NOT NULL")
+    op.execute(
+        "ALTER TABLE roles ALTER COLUMN permissions TYPE varchar(1000) USING permissions::text"
+    )
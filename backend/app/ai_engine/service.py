@@ -4,6 +4,7 @@ AI engine service for semantic matching and explainability
 from typing import Dict, List, Any, Optional
 import openai
 import structlog
+import threading
 import numpy as np
 
 from app.core.config import settings
@@ -14,11 +15,17 @@ logger = structlog.get_logger()
 # Lazy import for sentence_transformers (to avoid blocking celery workers)
 SentenceTransformer = None
 embedding_model = None
+# Worker threads share the model; only the first one to need it loads it
+_sentence_transformer_lock = threading.Lock()
 
 def _lazy_import_sentence_transformer():
     """Lazy import sentence_transformers to avoid blocking startup"""
     global SentenceTransformer, embedding_model
-    if SentenceTransformer is None:
+    if embedding_model is not None:
+        return SentenceTransformer, embedding_model
+    with _sentence_transformer_lock:
+        if embedding_model is not None:
+            return SentenceTransformer, embedding_model
         try:
             from sentence_transformers import SentenceTransformer as ST
             SentenceTransformer = ST
@@ -84,7 +91,8 @@ class AIEngine:
     
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text - uses HuggingFace (local) or OpenAI"""
-        cache_key = get_cache_key("embedding", self.provider, text[:100])
+        # Keyed by size too, so vectors cached before a dimension change are not reused
+        cache_key = get_cache_key("embedding", self.provider, settings.EMBEDDING_DIMENSION, text[:100])
         cached = get_cache(cache_key)
         if cached:
             return cached
@@ -94,9 +102,13 @@ class AIEngine:
             if self.provider == "huggingface" and self.huggingface_service and self.huggingface_service.get("embedding_model"):
                 embedding = self.huggingface_service["embedding_model"].encode(text).tolist()
             elif self.provider == "openai" and self.openai_client:
+                # text-embedding-3 models shorten their output to the requested size,
+                # so OpenAI vectors fit the same pgvector column as the local model's.
+                # Sent as a raw body field: the pinned openai client predates `dimensions=`
                 response = self.openai_client.embeddings.create(
                     model=settings.EMBEDDING_MODEL,
                     input=text,
+                    extra_body={"dimensions": settings.EMBEDDING_DIMENSION},
                 )
                 embedding = response.data[0].embedding
             else:
@@ -112,12 +124,15 @@ class AIEngine:
             return embedding
         except Exception as e:
             logger.error("embedding_generation_failed", error=str(e), provider=self.provider)
+            # A zero vector would be stored as if OpenAI had produced it; let the caller fail
+            if self.provider == "openai":
+                raise
             return self._simple_embedding(text)
     
     def _simple_embedding(self, text: str) -> List[float]:
         """Simple fallback embedding (not semantic)"""
         # This is a placeholder - in production, always use proper embeddings
-        return [0.0] * 384
+        return [0.0] * settings.EMBEDDING_DIMENSION
     
     def calculate_semantic_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """Calculate cosine similarity between embeddings"""
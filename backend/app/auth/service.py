@@ -84,8 +84,8 @@ def create_user(
     role_names: Optional[list[str]] = None,
 ) -> User:
     """Create a new user with roles"""
-    # Check if user exists
-    if get_user_by_email(db, email):
+    # Check if user exists (SELECT EXISTS, no row is loaded)
+    if db.query(db.query(User).filter(User.email == email).exists()).scalar():
         raise ValueError(f"User with email {email} already exists")
     
     # Create user
@@ -120,18 +120,17 @@ def list_candidates(
     
     candidates = query.order_by(Candidate.created_at.desc()).offset(skip).limit(limit).all()
     
+    # Resume quality scores for the whole page in one query (current versions only)
+    resume_ids = [c.resume_id for c in candidates if c.resume_id]
+    quality_scores = dict(
+        db.query(ResumeVersion.resume_id, ResumeVersion.quality_score)
+        .filter(ResumeVersion.resume_id.in_(resume_ids), ResumeVersion.is_current == True)
+        .all()
+    ) if resume_ids else {}
+    
     result = []
     for c in candidates:
-        # Get resume quality score if resume exists
-        resume_quality_score = None
-        if c.resume_id:
-            latest_version = (
-                db.query(ResumeVersion)
-                .filter(ResumeVersion.resume_id == c.resume_id, ResumeVersion.is_current == True)
-                .first()
-            )
-            if latest_version:
-                resume_quality_score = latest_version.quality_score
+        resume_quality_score = quality_scores.get(c.resume_id)
         
         result.append(
             CandidateResponse(
@@ -167,13 +166,12 @@ def get_candidate(
     # Get resume quality score if resume exists
     resume_quality_score = None
     if candidate.resume_id:
-        latest_version = (
-            db.query(ResumeVersion)
+        resume_quality_score = (
+            db.query(ResumeVersion.quality_score)
             .filter(ResumeVersion.resume_id == candidate.resume_id, ResumeVersion.is_current == True)
-            .first()
+            .limit(1)
+            .scalar()
         )
-        if latest_version:
-            resume_quality_score = latest_version.quality_score
     
     return CandidateResponse(
         id=candidate.id,
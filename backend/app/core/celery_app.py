@@ -2,7 +2,10 @@
 Celery application for async task processing
 """
 from celery import Celery
+from celery.signals import setup_logging, worker_init, worker_process_init, task_postrun
+from sqlalchemy.exc import OperationalError
 from app.core.config import settings
+from app.core.database import engine, TaskSession
 
 celery_app = Celery(
     "hirelens",
@@ -25,10 +28,72 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=300,  # 5 minutes
     task_soft_time_limit=240,  # 4 minutes
-    worker_prefetch_multiplier=4,
+    # Parse tasks range from seconds to minutes; reserving one message per worker
+    # thread keeps a slow task from holding a backlog that idle threads could run
+    worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     result_expires=3600,  # 1 hour
+    # Resume processing stages have different resource profiles; route them to
+    # separate queues so each can be given its own workers and concurrency
+    task_routes={
+        "app.tasks.resume_tasks.extract_resume_text_task": {"queue": "cpu-parse"},
+        "app.tasks.resume_tasks.parse_resume_task": {"queue": "gpu-ai"},
+        "app.tasks.resume_tasks.persist_resume_version_task": {"queue": "db-write"},
+        # Batches tasks need a worker with --prefetch-multiplier=0 to fill a batch
+        "app.tasks.resume_tasks.persist_resume_versions_batch": {"queue": "db-write-batch"},
+    },
 )
 
+
+# Errors worth retrying with exponential backoff (DB/network blips). Anything
+# else is treated as permanent and fails the task without retries.
+TRANSIENT_ERRORS = (OperationalError, ConnectionError, TimeoutError)
+RETRY_BACKOFF_MAX = 600  # Cap for the exponential retry delay, in seconds
+
+# Intra-op threads per worker process. Celery already runs several tasks
+# concurrently, so torch's default of one thread per core oversubscribes the CPU.
+TORCH_NUM_THREADS = 1
+
+
+def _limit_torch_threads():
+    # Imported here so the API process, which also loads this module, skips torch
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(TORCH_NUM_THREADS)
+
+
+@setup_logging.connect
+def init_worker_logging(**kwargs):
+    """Configure structlog/stdlib logging in the worker the same way as the API"""
+    # Imported here: the module configures logging on import, which the API does itself
+    from app.core.logging_config import configure_logging
+    configure_logging()
+
+
+@worker_init.connect
+def init_worker_threads(**kwargs):
+    """Cap torch threads in the worker's main process (threads/solo pools)"""
+    _limit_torch_threads()
+
+
+@worker_process_init.connect
+def init_worker_db(**kwargs):
+    """
+    Drop pooled connections inherited from the parent process after fork.
+    Only fires under prefork; the threads pool shares the parent's engine and
+    TaskSession hands each worker thread its own session.
+    """
+    engine.dispose(close=False)
+    TaskSession.remove()
+    # Thread pools are not carried across fork; apply the cap in the child too
+    _limit_torch_threads()
+
+
+@task_postrun.connect
+def release_task_session(**kwargs):
+    """Return the task's scoped session to the pool once the task finishes"""
+    TaskSession.remove()
@@ -23,6 +23,9 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_RECYCLE: int = 3600  # Seconds before a pooled connection is replaced
+    DATABASE_POOL_TIMEOUT: int = 30  # Seconds to wait for a free pooled connection
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 60000  # Server-side statement_timeout (0 disables)
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -43,6 +46,7 @@ class Settings(BaseSettings):
     # Hugging Face Configuration (Local Models - No API Keys Needed)
     HUGGINGFACE_MODEL: str = "microsoft/DialoGPT-medium"  # For text generation
     HUGGINGFACE_EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"  # For embeddings
+    EMBEDDING_DIMENSION: int = 384  # pgvector column size; OpenAI embeddings are requested at this size, the local model must emit it
     HUGGINGFACE_LLM_MODEL: str = "mistralai/Mistral-7B-Instruct-v0.1"  # For explanations (smaller: "TinyLlama/TinyLlama-1.1B-Chat-v1.0")
     # Resume Parser Models (auto-downloaded, no API keys needed)
     # Best Quality: "mistralai/Mistral-7B-Instruct-v0.1" (default, production-ready with quantization)
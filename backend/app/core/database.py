@@ -1,17 +1,40 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.pool import QueuePool
-from typing import Generator
+from typing import Any, Generator
+import json
 import structlog
 
 from app.core.config import settings
 
+# orjson serializes the large parsed_data/Kundali JSON columns several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger()
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _json_deserializer(value: str) -> Any:
+    """Deserialize JSON column values (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
@@ -19,12 +42,42 @@ engine = create_engine(
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,  # Verify connections before using
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,  # Replace connections before server/proxy idle cutoffs
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    connect_args=(
+        {"options": f"-c statement_timeout={settings.DATABASE_STATEMENT_TIMEOUT_MS}"}
+        if settings.DATABASE_STATEMENT_TIMEOUT_MS
+        else {}
+    ),
     echo=settings.DEBUG,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+    # psycopg2: INSERT executemany already uses multi-row VALUES (insertmanyvalues);
+    # also page UPDATE/DELETE executemany through execute_batch, e.g. ORM flushes of
+    # many dirty rows in the backfill scripts
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,  # Rows per execute_batch page (psycopg2 default is 100)
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session factory for the one-off maintenance scripts (backfills, reprocessing, cleanup).
+# Their bulk statements can legitimately outlast the engine-wide statement_timeout meant
+# for API and worker queries, so every transaction they open lifts it with SET LOCAL.
+MaintenanceSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@event.listens_for(MaintenanceSession, "after_begin")
+def _disable_statement_timeout(session, transaction, connection):
+    """Turn statement_timeout off for the current maintenance transaction"""
+    connection.exec_driver_sql("SET LOCAL statement_timeout = 0")
+
+
+# Thread-local session registry reused across Celery tasks in a worker process.
+# Sessions are released by the task_postrun signal in app.core.celery_app.
+TaskSession = scoped_session(SessionLocal)
+
 # Base class for models
 Base = declarative_base()
 
@@ -53,6 +106,11 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
 
 def init_db():
     """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+    # pgvector must be available before tables with vector columns are created.
+    # Schema DDL can outlast the API/worker statement_timeout, so lift it for this transaction.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("SET LOCAL statement_timeout = 0")
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        Base.metadata.create_all(bind=conn)
     logger.info("database_initialized")
 
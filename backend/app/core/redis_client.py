@@ -7,6 +7,13 @@ import json
 import structlog
 from app.core.config import settings
 
+# orjson (de)serializes cached parse results several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger()
 
 # Create Redis connection pool
@@ -21,12 +28,15 @@ redis_client = redis.from_url(
 )
 
 
+INVALIDATE_BATCH_SIZE = 1000  # Keys per SCAN page and per UNLINK in invalidate_pattern
+
+
 def get_cache(key: str) -> Optional[Any]:
     """Get value from cache"""
     try:
         value = redis_client.get(key)
         if value:
-            return json.loads(value)
+            return orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
         return None
     except Exception as e:
         logger.error("cache_get_error", key=key, error=str(e))
@@ -37,7 +47,10 @@ def set_cache(key: str, value: Any, ttl: Optional[int] = None) -> bool:
     """Set value in cache with optional TTL"""
     try:
         ttl = ttl or settings.REDIS_CACHE_TTL
-        serialized = json.dumps(value, default=str)
+        if ORJSON_AVAILABLE:
+            serialized = orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            serialized = json.dumps(value, default=str)
         return redis_client.setex(key, ttl, serialized)
     except Exception as e:
         logger.error("cache_set_error", key=key, error=str(e))
@@ -59,12 +72,27 @@ def get_cache_key(prefix: str, *args) -> str:
 
 
 def invalidate_pattern(pattern: str) -> int:
-    """Invalidate all keys matching pattern"""
+    """
+    Invalidate all keys matching pattern.
+    Keys are streamed with SCAN (KEYS blocks Redis for the whole keyspace) and
+    removed with UNLINK, which frees values in the background, in pipelined batches.
+    """
     try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            return redis_client.delete(*keys)
-        return 0
+        # Each full batch is flushed as it fills, so neither the key list nor the
+        # pipeline's command buffer grows with the size of the match
+        pipe = redis_client.pipeline(transaction=False)
+        batch = []
+        deleted = 0
+        for key in redis_client.scan_iter(match=pattern, count=INVALIDATE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= INVALIDATE_BATCH_SIZE:
+                pipe.unlink(*batch)
+                deleted += sum(pipe.execute())
+                batch.clear()
+        if batch:
+            pipe.unlink(*batch)
+            deleted += sum(pipe.execute())
+        return deleted
     except Exception as e:
         logger.error("cache_invalidate_error", pattern=pattern, error=str(e))
         return 0
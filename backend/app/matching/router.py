@@ -92,25 +92,34 @@ def get_candidate_rankings(
     # Rank all candidates for this job (recalculates matches and percentile ranks)
     match_results = matching_service.rank_candidates_for_job(db, job_id, limit)
     
+    # Candidates, explanations and Kundalis for every ranked match: three queries in total
+    candidate_ids = [mr.candidate_id for mr in match_results]
+    candidates = {
+        c.id: c for c in db.query(Candidate).filter(Candidate.id.in_(candidate_ids))
+    } if candidate_ids else {}
+    ai_explanations = {}
+    kundalis = {}
+    if match_results:
+        for explanation in db.query(AIExplanation).filter(
+            AIExplanation.match_result_id.in_([mr.id for mr in match_results])
+        ):
+            ai_explanations.setdefault(explanation.match_result_id, explanation)
+        kundalis = {
+            k.candidate_id: k
+            for k in db.query(CandidateKundali).filter(CandidateKundali.candidate_id.in_(candidate_ids))
+        }
+    
     rankings = []
     for match_result in match_results:
-        candidate = db.query(Candidate).filter(Candidate.id == match_result.candidate_id).first()
+        candidate = candidates.get(match_result.candidate_id)
         if not candidate:
             logger.warning("candidate_not_found_for_ranking", candidate_id=match_result.candidate_id)
             continue
             
-        ai_explanation = (
-            db.query(AIExplanation)
-            .filter(AIExplanation.match_result_id == match_result.id)
-            .first()
-        )
+        ai_explanation = ai_explanations.get(match_result.id)
         
         # Get Kundali data if available
-        kundali = (
-            db.query(CandidateKundali)
-            .filter(CandidateKundali.candidate_id == candidate.id)
-            .first()
-        )
+        kundali = kundalis.get(candidate.id)
         
         kundali_summary = None
         if kundali:
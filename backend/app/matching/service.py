@@ -2,7 +2,7 @@
 Matching service - orchestrates scoring and AI explanation
 """
 from typing import Dict, List, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 import structlog
 
 from app.matching.scoring import scoring_engine
@@ -52,6 +52,7 @@ class MatchingService:
         # Get resume data
         resume_version = (
             db.query(ResumeVersion)
+            .options(defer(ResumeVersion.parsed_data))  # Scoring reads the typed columns only
             .join(ResumeVersion.resume)
             .filter(
                 ResumeVersion.resume_id == candidate.resume_id,
@@ -294,6 +295,7 @@ class MatchingService:
             # Get resume data
             resume_version = (
                 db.query(ResumeVersion)
+                .options(defer(ResumeVersion.parsed_data))
                 .join(ResumeVersion.resume)
                 .filter(
                     ResumeVersion.resume_id == candidate.resume_id,
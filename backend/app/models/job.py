@@ -4,6 +4,8 @@ Job Description models
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from pgvector.sqlalchemy import Vector
+from app.core.config import settings
 from app.core.database import Base
 
 
@@ -35,7 +37,7 @@ class JobDescription(Base):
     employment_type = Column(String(50))  # full-time, part-time, contract, etc.
     
     # AI processing
-    embedding = Column(JSON)  # Vector embedding for semantic search
+    embedding = Column(Vector(settings.EMBEDDING_DIMENSION))  # pgvector embedding, EMBEDDING_DIMENSION values
     processed_at = Column(DateTime(timezone=True))
     
     # Status
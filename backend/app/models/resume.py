@@ -1,9 +1,10 @@
 """
 Resume models
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.core.database import Base
 
 
@@ -32,13 +33,19 @@ class ResumeVersion(Base):
     """Resume version for auditability"""
     
     __tablename__ = "resume_versions"
+    __table_args__ = (
+        # Current-version lookups and next-version numbering during resume processing
+        # Partial index: one entry per resume, only the current version
+        Index("ix_resume_versions_current", "resume_id", postgresql_where=text("is_current")),
+        Index("ix_resume_versions_resume_version", "resume_id", "version_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
     version_number = Column(Integer, nullable=False)
     
     # Structured parsed data
-    parsed_data = Column(JSON)  # Full parsed structure
+    parsed_data = Column(JSONB)  # Full parsed structure (binary jsonb, no reparse on read)
     
     # Extracted fields
     skills = Column(JSON)  # List of skills
@@ -1,7 +1,8 @@
 """
 User and Role models
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Table, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -19,11 +20,20 @@ class Role(Base):
     """Role model for RBAC"""
     
     __tablename__ = "roles"
+    __table_args__ = (
+        # Containment lookups such as permissions @> '["jobs:write"]'
+        Index(
+            "ix_roles_permissions_gin",
+            "permissions",
+            postgresql_using="gin",
+            postgresql_ops={"permissions": "jsonb_path_ops"},
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False, index=True)
     description = Column(String(255))
-    permissions = Column(String(1000))  # JSON string of permissions
+    permissions = Column(JSONB, nullable=False, default=list)  # List of permission strings
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -1,7 +1,7 @@
 """
 AI-powered resume parser using LLM for intelligent extraction
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, date
 from pathlib import Path
 import re
@@ -12,6 +12,7 @@ from dateutil.relativedelta import relativedelta
 from app.ai_engine.service import ai_engine
 from app.core.config import settings
 from app.core.redis_client import get_cache, set_cache, get_cache_key
+from app.resumes.parser import ResumeDoc
 
 logger = structlog.get_logger()
 
@@ -22,16 +23,18 @@ class AIParser:
     def __init__(self):
         self.ai_engine = ai_engine
     
-    def parse_with_ai(self, raw_text: str, pdf_path: Optional[str] = None, force_reprocess: bool = False) -> Dict[str, Any]:
+    def parse_with_ai(self, raw_text: Union[str, ResumeDoc], pdf_path: Optional[str] = None, force_reprocess: bool = False) -> Dict[str, Any]:
         """
         Parse resume using Vision + Layout + Semantic hybrid approach
         Strategy: LayoutLMv3 (vision+layout) -> Section-aware extraction -> NER (within sections) -> Optional LLM refinement
         
         Args:
-            raw_text: Raw text from resume
+            raw_text: Raw text from resume, or a ResumeDoc wrapping it
             pdf_path: Optional path to PDF file
             force_reprocess: If True, skip cache and reprocess
         """
+        if isinstance(raw_text, ResumeDoc):
+            raw_text = raw_text.text
         cache_key = get_cache_key("ai_parse", "resume", raw_text[:200])
         
         # Skip cache if force_reprocess is True
@@ -708,12 +711,7 @@ IMPORTANT:
         
         # Data completeness (5 points)
         # Check if we have at least some data in multiple categories
-        categories_with_data = sum([
-            1 if skills else 0,
-            1 if experience else 0,
-            1 if education else 0,
-            1 if projects else 0,
-        ])
+        categories_with_data = bool(skills) + bool(experience) + bool(education) + bool(projects)
         if categories_with_data >= 3:
             score += 5
         
@@ -723,11 +721,11 @@ IMPORTANT:
         if used_layoutlm and metadata.get("used_layoutlm"):
             # LayoutLM was successfully used - highest confidence
             score += 15
-            logger.info("layoutlm_bonus_applied", bonus=15)
+            logger.debug("layoutlm_bonus_applied", bonus=15)
         elif metadata.get("used_text_based_detection"):
             # Text-based section detection (still layout-aware via position)
             score += 8
-            logger.info("text_based_layout_bonus_applied", bonus=8)
+            logger.debug("text_based_layout_bonus_applied", bonus=8)
         
         # Penalize fallback usage (indicates layout parsing failed)
         if metadata.get("parser_version") == "text-fallback":
@@ -737,7 +735,7 @@ IMPORTANT:
         # OCR usage bonus (scanned PDFs are harder but handled correctly)
         if metadata.get("used_ocr"):
             # OCR was used successfully - don't penalize, it's correct handling
-            logger.info("ocr_used_quality_maintained")
+            logger.debug("ocr_used_quality_maintained")
         
         return min(score, max_score)
 
@@ -5,14 +5,18 @@ Uses local models - no API keys required, models auto-download
 from typing import Dict, List, Any, Optional
 import json
 import re
+import threading
 import structlog
-from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM
 import torch
 
 from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Worker threads share the module parser; only the first one to need the model loads it
+_text_generator_lock = threading.Lock()
+
 
 class HFPDFParser:
     """Hugging Face PDF Parser for world-class resume extraction - Local models only"""
@@ -76,7 +80,9 @@ class HFPDFParser:
         try:
             # Initialize text generator if not already done
             if self.text_generator is None:
-                self._init_text_generator()
+                with _text_generator_lock:
+                    if self.text_generator is None:
+                        self._init_text_generator()
             
             if self.text_generator is None:
                 logger.warning("text_generator_not_available")
@@ -212,17 +218,18 @@ Return ONLY valid JSON, no markdown."""
                     model_kwargs["max_memory"] = settings.model_max_memory_dict
                 
                 # Load model
-                self.text_generator = AutoModelForCausalLM.from_pretrained(
+                model = AutoModelForCausalLM.from_pretrained(
                     self.model_name,
                     **model_kwargs
                 )
                 
                 # Move to CPU if not using device_map
                 if self.device == "cpu" and "device_map" not in model_kwargs:
-                    self.text_generator = self.text_generator.to(self.device)
+                    model = model.to(self.device)
                 
-                # Store tokenizer for later use
+                # Publish the tokenizer before the model: other threads only check text_generator
                 self.tokenizer = tokenizer
+                self.text_generator = model
                 
                 logger.info("local_hf_model_loaded_production", 
                           model=self.model_name, 
@@ -250,13 +257,14 @@ Return ONLY valid JSON, no markdown."""
                     if tokenizer.pad_token is None:
                         tokenizer.pad_token = tokenizer.eos_token
                     
-                    self.text_generator = AutoModelForCausalLM.from_pretrained(
+                    model = AutoModelForCausalLM.from_pretrained(
                         self.model_name,
                         torch_dtype=torch.float32,
                         low_cpu_mem_usage=True,
                     ).to(self.device)
                     
                     self.tokenizer = tokenizer
+                    self.text_generator = model
                     logger.info("fallback_model_loaded", model=self.model_name)
                 except Exception as e3:
                     logger.error("all_models_failed", error=str(e3))
@@ -4,10 +4,11 @@ Candidate Kundali Parser - Masterpiece Architecture v2.0
 Resume-as-Source-of-Truth: Image-First Extraction using Qwen Vision
 Extracts structured data + behavioral signals + personality inference
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 import json
 import re
+import threading
 import structlog
 import requests
 from PIL import Image
@@ -16,6 +17,7 @@ import base64
 
 from app.core.config import settings
 from app.core.redis_client import get_cache, set_cache, get_cache_key
+from app.resumes.parser import ResumeDoc
 
 logger = structlog.get_logger()
 
@@ -30,6 +32,18 @@ OLLAMA_VISION_MODELS = [
 ]
 OLLAMA_MODEL = "qwen2.5:7b-instruct-q4_K_M"  # Text-only (confirmed available)
 OLLAMA_FALLBACK_MODEL = "qwen2.5:7b-instruct-q4_K_M"  # Text-only fallback
+VISION_PAGE_DPI = 150  # Resolution used when rendering PDF pages for the vision model
+
+# requests.Session is not thread-safe; each worker thread keeps its own keep-alive pool
+_session_local = threading.local()
+
+
+def _ollama_session() -> requests.Session:
+    """Return this thread's HTTP session for Ollama calls"""
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = _session_local.session = requests.Session()
+    return session
 
 
 class CandidateKundaliParser:
@@ -48,9 +62,10 @@ class CandidateKundaliParser:
         self.ollama_endpoint = OLLAMA_ENDPOINT
         self.fallback_model = OLLAMA_FALLBACK_MODEL
         
-        # Check Ollama availability and find vision model
-        self.ollama_available = self._check_ollama_availability()
-        self.vision_model = self._find_available_vision_model() if self.ollama_available else None
+        # Check Ollama availability and find vision model (a single /api/tags request)
+        model_names = self._fetch_ollama_models()
+        self.ollama_available = model_names is not None
+        self.vision_model = self._find_available_vision_model(model_names) if self.ollama_available else None
         self.use_vision = self.vision_model is not None
         
         logger.info("kundali_parser_initialized", 
@@ -58,49 +73,44 @@ class CandidateKundaliParser:
                    vision_model=self.vision_model,
                    use_vision=self.use_vision)
     
-    def _check_ollama_availability(self) -> bool:
-        """Check if Ollama is available"""
+    def _fetch_ollama_models(self) -> Optional[List[str]]:
+        """Return the installed Ollama model names, or None if Ollama is not available"""
         try:
-            response = requests.get(f"{self.ollama_endpoint}/api/tags", timeout=5)
-            return response.status_code == 200
+            response = _ollama_session().get(f"{self.ollama_endpoint}/api/tags", timeout=5)
+            if response.status_code != 200:
+                return None
+            return [m.get("name", "") for m in response.json().get("models", [])]
         except Exception as e:
             logger.warning("ollama_not_available", error=str(e))
-            return False
+            return None
     
-    def _find_available_vision_model(self) -> Optional[str]:
+    def _find_available_vision_model(self, model_names: List[str]) -> Optional[str]:
         """Find available vision model from list of possible names"""
-        try:
-            response = requests.get(f"{self.ollama_endpoint}/api/tags", timeout=5)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                model_names = [m.get("name", "") for m in models]
-                
-                # Try each vision model name
-                for vision_model in OLLAMA_VISION_MODELS:
-                    if any(vision_model in name or name.startswith(vision_model.split(":")[0]) for name in model_names):
-                        # Check if it's actually a vision model (contains 'vl' or 'vision')
-                        matching_models = [name for name in model_names if vision_model.split(":")[0] in name.lower() and ('vl' in name.lower() or 'vision' in name.lower())]
-                        if matching_models:
-                            logger.info("vision_model_found", model=matching_models[0])
-                            return matching_models[0]
-                
-                logger.warning("no_vision_model_found", available_models=model_names)
-                return None
-        except Exception as e:
-            logger.warning("error_finding_vision_model", error=str(e))
-            return None
+        # Try each vision model name
+        for vision_model in OLLAMA_VISION_MODELS:
+            if any(vision_model in name or name.startswith(vision_model.split(":")[0]) for name in model_names):
+                # Check if it's actually a vision model (contains 'vl' or 'vision')
+                matching_models = [name for name in model_names if vision_model.split(":")[0] in name.lower() and ('vl' in name.lower() or 'vision' in name.lower())]
+                if matching_models:
+                    logger.info("vision_model_found", model=matching_models[0])
+                    return matching_models[0]
+        
+        logger.warning("no_vision_model_found", available_models=model_names)
+        return None
     
-    def parse_resume(self, pdf_path: str, text_from_pdf: Optional[str] = None) -> Dict[str, Any]:
+    def parse_resume(self, pdf_path: str, text_from_pdf: Optional[Union[str, ResumeDoc]] = None) -> Dict[str, Any]:
         """
         Main parsing method: PDF → Direct to Qwen → Candidate Kundali
         
         Args:
             pdf_path: Path to PDF file
-            text_from_pdf: Optional extracted text (used for text-only models)
+            text_from_pdf: Optional extracted text or ResumeDoc (used for text-only models)
         
         Returns:
             Candidate Kundali (structured JSON with confidence scores)
         """
+        if isinstance(text_from_pdf, ResumeDoc):
+            text_from_pdf = text_from_pdf.text
         logger.info("kundali_parsing_started", pdf_path=pdf_path)
         
         try:
@@ -172,8 +182,12 @@ class CandidateKundaliParser:
             Candidate Kundali dictionary
         """
         try:
-            # Convert PDF to base64
-            pdf_base64 = base64.b64encode(pdf_data).decode()
+            # Vision models get every rendered page in a single request so the
+            # whole resume is encoded as one batch instead of page-by-page calls
+            page_images = [] if use_text_model else self._render_pdf_pages(pdf_data)
+            if not page_images:
+                # Fall back to sending the raw PDF as base64
+                page_images = [base64.b64encode(pdf_data).decode()]
             
             # Build master prompt
             prompt = self._build_master_prompt()
@@ -188,7 +202,7 @@ class CandidateKundaliParser:
                 {
                     "role": "user",
                     "content": prompt,
-                    "images": [pdf_base64] if not use_text_model else None  # PDF as base64 for vision models
+                    "images": page_images if not use_text_model else None  # Page images for vision models
                 }
             ]
             
@@ -196,7 +210,7 @@ class CandidateKundaliParser:
             messages[0] = {k: v for k, v in messages[0].items() if v is not None}
             
             # Call Ollama API
-            response = requests.post(
+            response = _ollama_session().post(
                 f"{self.ollama_endpoint}/api/chat",
                 json={
                     "model": model_to_use,
@@ -237,6 +251,37 @@ class CandidateKundaliParser:
             logger.error("qwen_pdf_extraction_failed", error=str(e), exc_info=True)
             return self._empty_kundali()
     
+    def _render_pdf_pages(self, pdf_data: bytes) -> List[str]:
+        """
+        Render all PDF pages to base64-encoded PNG images
+        
+        Args:
+            pdf_data: PDF file as bytes
+        
+        Returns:
+            List of base64 PNG strings, one per page (empty if rendering fails)
+        """
+        try:
+            import pdf2image
+        except ImportError:
+            logger.warning("pdf2image_not_available_sending_raw_pdf")
+            return []
+        
+        try:
+            pages = pdf2image.convert_from_bytes(pdf_data, dpi=VISION_PAGE_DPI, fmt="png")
+        except Exception as e:
+            logger.warning("pdf_page_rendering_failed", error=str(e))
+            return []
+        
+        encoded_pages = []
+        for page in pages:
+            buffer = io.BytesIO()
+            page.save(buffer, format="PNG")
+            encoded_pages.append(base64.b64encode(buffer.getvalue()).decode())
+        
+        logger.info("pdf_pages_rendered_for_vision", pages=len(encoded_pages), dpi=VISION_PAGE_DPI)
+        return encoded_pages
+    
     def _build_master_prompt(self) -> str:
         """
         Build the MASTER EXTRACTION PROMPT for Qwen
@@ -498,7 +543,7 @@ Return ONLY valid JSON. No explanations, no markdown, just JSON.
             # Add the extracted text to the prompt
             full_prompt = f"{prompt}\n\nRESUME TEXT CONTENT:\n{text}\n\nNow extract the Candidate Kundali from the above resume text."
             
-            response = requests.post(
+            response = _ollama_session().post(
                 f"{self.ollama_endpoint}/api/chat",
                 json={
                     "model": self.fallback_model,
@@ -5,6 +5,7 @@ Uses microsoft/layoutlmv3-large for pixel-level + layout-aware understanding
 from typing import List, Dict, Any, Optional
 from PIL import Image
 import structlog
+import threading
 import torch
 from transformers import LayoutLMv3Processor, LayoutLMv3ForTokenClassification
 import numpy as np
@@ -15,9 +16,18 @@ logger = structlog.get_logger()
 _processor = None
 _model = None
 _device = None
+# Worker threads share these globals; only the first one to need the model loads it
+_load_lock = threading.Lock()
 
 
 def _load_layoutlmv3(device: Optional[str] = None):
+    """Return the shared LayoutLMv3 processor/model, loading them once under a lock"""
+    # No unlocked fast path: _model is published before it is moved to its device
+    with _load_lock:
+        return _load_layoutlmv3_unlocked(device)
+
+
+def _load_layoutlmv3_unlocked(device: Optional[str] = None):
     """Lazy load LayoutLMv3 model and processor with crash protection"""
     global _processor, _model, _device
     
@@ -6,6 +6,7 @@ Supports: Ollama API (fast, pre-downloaded) or Hugging Face (slower, downloads o
 from typing import Dict, List, Any, Optional
 import json
 import re
+import threading
 import structlog
 import torch
 
@@ -33,6 +34,8 @@ _ollama_client = None
 _ollama_model = None
 _ollama_endpoint = None
 _use_ollama = False
+# Worker threads share these globals; only the first one to need the model loads it
+_load_lock = threading.Lock()
 
 
 def _check_ollama_available(model_name: str = "qwen2.5:7b") -> bool:
@@ -99,6 +102,12 @@ def _check_ollama_available(model_name: str = "qwen2.5:7b") -> bool:
 
 
 def _load_local_llm(model_name: str = "Qwen/Qwen2.5-7B-Instruct", device: Optional[str] = None):
+    """Return the shared local LLM, checking Ollama and loading it under a lock"""
+    with _load_lock:
+        return _load_local_llm_unlocked(model_name, device)
+
+
+def _load_local_llm_unlocked(model_name: str = "Qwen/Qwen2.5-7B-Instruct", device: Optional[str] = None):
     """Lazy load local LLM for semantic normalization
     Priority: Ollama (if available) > Hugging Face
     """
@@ -3,9 +3,11 @@ Smart Resume Validator - Validates if uploaded document is actually a resume
 Uses content analysis and pattern matching to detect resume-like documents
 """
 import re
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Union
 import structlog
 
+from app.resumes.parser import ResumeDoc, as_resume_doc
+
 logger = structlog.get_logger()
 
 
@@ -67,14 +69,25 @@ class ResumeValidator:
     MIN_RESUME_SCORE = 30  # Minimum score to be considered a resume
     MIN_TEXT_LENGTH = 200  # Minimum text length to be a valid resume
     
-    def validate(self, text: str) -> Tuple[bool, Dict[str, any]]:
+    def __init__(self):
+        # Compile the regex indicators once per validator instance (module singletons reuse them)
+        self._email_re = re.compile(self.RESUME_INDICATORS['email_pattern'])
+        self._phone_re = re.compile(self.RESUME_INDICATORS['phone_pattern'])
+        self._date_re = re.compile(self.RESUME_INDICATORS['date_pattern'])
+    
+    def validate(self, doc: Union[str, ResumeDoc]) -> Tuple[bool, Dict[str, any]]:
         """
         Validate if text represents a resume
         
+        Args:
+            doc: Resume text, or a ResumeDoc with precomputed measurements
+        
         Returns:
             Tuple[is_valid, details_dict]
         """
-        if not text or len(text.strip()) < self.MIN_TEXT_LENGTH:
+        doc = as_resume_doc(doc)
+        text = doc.text
+        if doc.n_chars < self.MIN_TEXT_LENGTH:
             return False, {
                 'reason': 'text_too_short',
                 'score': 0,
@@ -98,20 +111,20 @@ class ResumeValidator:
         }
         
         # Check email (high weight: +15)
-        email_match = re.search(self.RESUME_INDICATORS['email_pattern'], text)
+        email_match = self._email_re.search(text)
         if email_match:
             score += 15
             details['has_email'] = True
             details['email_found'] = email_match.group(0)
         
         # Check phone (high weight: +10)
-        phone_match = re.search(self.RESUME_INDICATORS['phone_pattern'], text)
+        phone_match = self._phone_re.search(text)
         if phone_match:
             score += 10
             details['has_phone'] = True
         
         # Check date patterns (medium weight: +10)
-        date_matches = len(re.findall(self.RESUME_INDICATORS['date_pattern'], text_upper))
+        date_matches = len(self._date_re.findall(text_upper))
         if date_matches >= 2:  # At least 2 date ranges
             score += 10
             details['has_dates'] = True
@@ -3,11 +3,10 @@ Resume processing routes
 """
 import os
 import uuid
-import json
 from pathlib import Path
 from typing import List
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, load_only
 import structlog
 
 from app.core.database import get_db
@@ -19,13 +18,28 @@ from app.models.resume import Resume, ResumeVersion
 from app.resumes.parser import ResumeParser
 from app.resumes.resume_validator import ResumeValidator
 from app.resumes.schemas import ResumeResponse, ResumeDetailResponse, ResumeVersionResponse
-from app.tasks.resume_tasks import process_resume_task
+from app.tasks.resume_tasks import dispatch_resume_processing, resolve_processing_statuses
 
 router = APIRouter(prefix="/api/v1/resumes", tags=["Resumes"])
 logger = structlog.get_logger()
 parser = ResumeParser()
 resume_validator = ResumeValidator()
 
+_PERSONAL_INFO_FIELDS = ("first_name", "last_name", "email", "phone", "linkedin_url", "portfolio_url")
+
+# parsed_data JSONB paths read by the detail view, keyed by result label
+_PARSED_IDENTITY_PATHS = {
+    "name": "name",
+    "first_name": "first_name",
+    "last_name": "last_name",
+    "email": "email",
+    "phone": "phone",
+    "linkedin_url": "linkedin_url",
+    "portfolio_url": "portfolio_url",
+    "contact_linkedin": ("contact", "linkedin"),
+    "contact_portfolio": ("contact", "portfolio"),
+}
+
 # Ensure upload directory exists
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
@@ -121,7 +135,7 @@ def upload_resume(
     db.refresh(resume)
     
     # Trigger async processing
-    process_resume_task.delay(resume.id)
+    dispatch_resume_processing(resume.id)
     
     logger.info("resume_uploaded", resume_id=resume.id, file_name=file.filename)
     
@@ -143,14 +157,26 @@ def list_resumes(
     db: Session = Depends(get_db),
 ):
     """List all resumes"""
-    resumes = db.query(Resume).offset(skip).limit(limit).all()
+    # Only the listed columns; raw_text can be tens of KB per resume
+    resumes = (
+        db.query(Resume)
+        .options(load_only(
+            Resume.id, Resume.file_name, Resume.file_size, Resume.file_type,
+            Resume.processing_status, Resume.created_at,
+        ))
+        .order_by(Resume.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    statuses = resolve_processing_statuses(resumes)
     return [
         ResumeResponse(
             id=r.id,
             file_name=r.file_name,
             file_size=r.file_size,
             file_type=r.file_type,
-            processing_status=r.processing_status,
+            processing_status=statuses[r.id],
             created_at=r.created_at,
         )
         for r in resumes
@@ -168,9 +194,10 @@ def get_resume(
     if not resume:
         raise NotFoundError("Resume", str(resume_id))
     
-    # Get latest version
+    # Get latest version (parsed_data is only needed for a few identity fields, fetched below)
     latest_version = (
         db.query(ResumeVersion)
+        .options(defer(ResumeVersion.parsed_data))
         .filter(ResumeVersion.resume_id == resume_id, ResumeVersion.is_current == True)
         .first()
     )
@@ -192,39 +219,36 @@ def get_resume(
         }
     
     # Also check parsed_data (fallback or additional info)
-    if latest_version and latest_version.parsed_data:
-        # parsed_data is stored as JSON, might be dict or string
-        parsed_data = latest_version.parsed_data
-        if isinstance(parsed_data, str):
-            try:
-                parsed_data = json.loads(parsed_data)
-            except (json.JSONDecodeError, TypeError):
-                parsed_data = {}
-        if isinstance(parsed_data, dict):
-            # Only fill in missing fields from parsed_data
-            if not personal_info.get("first_name"):
-                # Try to split name if first_name not available
-                name = parsed_data.get("name") or parsed_data.get("first_name", "")
-                if name and name != "unknown":
-                    name_parts = name.split(" ", 1)
-                    personal_info["first_name"] = name_parts[0] if name_parts else ""
-                    personal_info["last_name"] = name_parts[1] if len(name_parts) > 1 else ""
-                else:
-                    personal_info["first_name"] = parsed_data.get("first_name") or ""
-                    personal_info["last_name"] = parsed_data.get("last_name") or ""
-            
-            # Fill in other missing fields
-            if not personal_info.get("email"):
-                personal_info["email"] = parsed_data.get("email") or ""
-            if not personal_info.get("phone"):
-                personal_info["phone"] = parsed_data.get("phone") or ""
-            if not personal_info.get("linkedin_url"):
-                # Check contact object too
-                contact = parsed_data.get("contact", {})
-                personal_info["linkedin_url"] = parsed_data.get("linkedin_url") or contact.get("linkedin") or ""
-            if not personal_info.get("portfolio_url"):
-                contact = parsed_data.get("contact", {})
-                personal_info["portfolio_url"] = parsed_data.get("portfolio_url") or contact.get("portfolio") or ""
+    if latest_version and not all(personal_info.get(f) for f in _PERSONAL_INFO_FIELDS):
+        # Extract just the identity fields server-side instead of loading the whole JSONB blob
+        parsed = (
+            db.query(*(ResumeVersion.parsed_data[path].astext.label(label)
+                       for label, path in _PARSED_IDENTITY_PATHS.items()))
+            .filter(ResumeVersion.id == latest_version.id)
+            .one()
+        )
+        # Only fill in missing fields from parsed_data
+        if not personal_info.get("first_name"):
+            # Try to split name if first_name not available
+            name = parsed.name or parsed.first_name or ""
+            if name and name != "unknown":
+                name_parts = name.split(" ", 1)
+                personal_info["first_name"] = name_parts[0] if name_parts else ""
+                personal_info["last_name"] = name_parts[1] if len(name_parts) > 1 else ""
+            else:
+                personal_info["first_name"] = parsed.first_name or ""
+                personal_info["last_name"] = parsed.last_name or ""
+        
+        # Fill in other missing fields
+        if not personal_info.get("email"):
+            personal_info["email"] = parsed.email or ""
+        if not personal_info.get("phone"):
+            personal_info["phone"] = parsed.phone or ""
+        if not personal_info.get("linkedin_url"):
+            # Check contact object too
+            personal_info["linkedin_url"] = parsed.linkedin_url or parsed.contact_linkedin or ""
+        if not personal_info.get("portfolio_url"):
+            personal_info["portfolio_url"] = parsed.portfolio_url or parsed.contact_portfolio or ""
     
     # Normalize skills format (dict to list) if needed
     normalized_skills = None
@@ -234,14 +258,8 @@ def get_resume(
     # Normalize experience format for frontend compatibility
     normalized_experience = None
     if latest_version and latest_version.experience:
-        import json
+        # JSON columns come back already decoded by the engine's (orjson) deserializer
         experience_data = latest_version.experience
-        if isinstance(experience_data, str):
-            try:
-                experience_data = json.loads(experience_data)
-            except (json.JSONDecodeError, TypeError):
-                experience_data = []
-        
         if isinstance(experience_data, list):
             normalized_experience = []
             for exp in experience_data:
@@ -276,7 +294,7 @@ def get_resume(
         file_name=resume.file_name,
         file_size=resume.file_size,
         file_type=resume.file_type,
-        processing_status=resume.processing_status,
+        processing_status=resolve_processing_statuses([resume])[resume.id],
         raw_text=resume.raw_text,
         created_at=resume.created_at,
         latest_version=ResumeVersionResponse(
@@ -309,8 +327,8 @@ def reprocess_resume(
     resume.processing_status = "pending"
     db.commit()
     
-    # Trigger async processing
-    process_resume_task.delay(resume.id)
+    # Trigger async processing (an explicit reprocess must not be served from the parse cache)
+    dispatch_resume_processing(resume.id, force_reprocess=True)
     
     logger.info("resume_reprocessing", resume_id=resume.id)
     
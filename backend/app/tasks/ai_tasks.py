@@ -2,13 +2,20 @@
 AI-related async tasks
 """
 from celery import Task
-from app.core.celery_app import celery_app
+from app.core.celery_app import celery_app, TRANSIENT_ERRORS, RETRY_BACKOFF_MAX
 import structlog
 
 logger = structlog.get_logger()
 
 
-@celery_app.task(bind=True, max_retries=2)
+@celery_app.task(
+    bind=True,
+    max_retries=2,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    retry_jitter=True,
+)
 def generate_embedding_task(self: Task, text: str, cache_key: str):
     """Generate embedding asynchronously"""
     from app.ai_engine.service import ai_engine
@@ -20,5 +27,6 @@ def generate_embedding_task(self: Task, text: str, cache_key: str):
         return cache_key
     except Exception as e:
         logger.error("embedding_generation_failed", error=str(e))
-        raise self.retry(exc=e, countdown=60)
+        # Let autoretry_for decide whether this error is worth retrying
+        raise
 
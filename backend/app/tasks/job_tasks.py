@@ -3,8 +3,9 @@ Job description processing tasks
 """
 from celery import Task
 from sqlalchemy.orm import Session
-from app.core.celery_app import celery_app
-from app.core.database import SessionLocal
+from app.core.celery_app import celery_app, TRANSIENT_ERRORS, RETRY_BACKOFF_MAX
+from app.core.config import settings
+from app.core.database import TaskSession
 from app.models.job import JobDescription
 from app.ai_engine.service import ai_engine
 from datetime import datetime
@@ -13,10 +14,17 @@ import structlog
 logger = structlog.get_logger()
 
 
-@celery_app.task(bind=True, max_retries=3)
+@celery_app.task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    retry_jitter=True,
+)
 def process_job_description_task(self: Task, job_id: int):
     """Process job description and generate embeddings"""
-    db: Session = SessionLocal()
+    db: Session = TaskSession()
     try:
         job = db.query(JobDescription).filter(JobDescription.id == job_id).first()
         if not job:
@@ -24,22 +32,24 @@ def process_job_description_task(self: Task, job_id: int):
             return
         
         # Generate embedding
-        try:
-            text_for_embedding = f"{job.title} {job.raw_text or ''}"
-            embedding = ai_engine.generate_embedding(text_for_embedding[:2000])  # Limit length
-            job.embedding = embedding
-            job.processed_at = datetime.utcnow()
-            db.commit()
-            
-            logger.info("job_processed", job_id=job_id)
-        except Exception as e:
-            logger.error("job_processing_failed", job_id=job_id, error=str(e))
-            # Don't fail the job, just log the error
-            db.rollback()
+        text_for_embedding = f"{job.title} {job.raw_text or ''}"
+        embedding = ai_engine.generate_embedding(text_for_embedding[:2000])  # Limit length
+        # The column is vector(EMBEDDING_DIMENSION); a provider/model emitting another
+        # size is a configuration error and must fail the task, not drop the embedding
+        if len(embedding) != settings.EMBEDDING_DIMENSION:
+            raise ValueError(
+                f"Embedding from provider '{ai_engine.provider}' has {len(embedding)} values, "
+                f"expected EMBEDDING_DIMENSION={settings.EMBEDDING_DIMENSION}"
+            )
+        job.embedding = embedding
+        job.processed_at = datetime.utcnow()
+        db.commit()
+        
+        logger.info("job_processed", job_id=job_id)
         
     except Exception as e:
+        db.rollback()
         logger.exception("job_processing_error", job_id=job_id, error=str(e))
-        raise self.retry(exc=e, countdown=60)
-    finally:
-        db.close()
+        # Let autoretry_for decide whether this error is worth retrying
+        raise
 
@@ -1,23 +1,111 @@
 """
 Resume processing tasks
 """
-from celery import Task
+from celery import Task, chain
+from sqlalchemy import JSON, bindparam, text, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
-from app.core.celery_app import celery_app
-from app.core.database import SessionLocal
-from app.models.resume import Resume, ResumeVersion
-from app.resumes.parser import ResumeParser
+from app.core.celery_app import celery_app, TRANSIENT_ERRORS, RETRY_BACKOFF_MAX
+from app.core.database import TaskSession
+from app.core.redis_client import redis_client, get_cache, set_cache, get_cache_key
+from app.models.resume import Resume
+from app.models.candidate import Candidate
+from app.resumes.parser import ResumeParser, ResumeDoc
 from app.resumes.ai_parser import ai_parser
 from app.resumes.resume_validator import ResumeValidator
 from app.resumes.seniority_analyzer import elite_seniority_analyzer
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, TypedDict
+from functools import lru_cache
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from sqlalchemy.orm import Session
 import structlog
+import hashlib
 import re
+import threading
+
+# Optional SIMD regex engine used to prefilter contact scans
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Optional micro-batching of the persist stage for bulk ingest
+try:
+    from celery_batches import Batches
+    CELERY_BATCHES_AVAILABLE = True
+except ImportError:
+    CELERY_BATCHES_AVAILABLE = False
+
+# Resolve the Kundali parser and model once at import instead of on every task run
+try:
+    from app.resumes.kundali_parser import kundali_parser
+    from app.models.candidate_kundali import CandidateKundali
+    _HAS_KUNDALI = True
+except ImportError:
+    kundali_parser = None
+    CandidateKundali = None
+    _HAS_KUNDALI = False
 
 logger = structlog.get_logger()
 parser = ResumeParser()
 resume_validator = ResumeValidator()
+_calc_quality = ai_parser._calculate_quality_score
+
+# Contact fallback patterns, compiled once per worker. They run on the UTF-8
+# bytes of the resume text (emails/phones are ASCII), which is also what
+# Hyperscan scans, so match offsets need no str conversion.
+# Possessive quantifiers (Python 3.11+) never give back characters that the
+# following token could not match anyway, so results are unchanged but
+# adversarial runs of digits/separators cannot trigger backtracking.
+_EMAIL_RE = re.compile(rb'\b[A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Common phone patterns: (123) 456-7890, 123-456-7890, +1-123-456-7890, etc.
+_PHONE_RES = (
+    re.compile(rb'\(?+\d{3}\)?+[-.\s]?+\d{3}[-.\s]?+\d{4}'),  # (123) 456-7890 or 123-456-7890
+    re.compile(rb'\+?+\d{1,3}[-.\s]?+\d{3}[-.\s]?+\d{3}[-.\s]?+\d{4}'),  # +1-123-456-7890
+    re.compile(rb'\d{10}'),  # 1234567890
+)
+# Contact details almost always sit in the resume header, so the fallback scans
+# look at the first CONTACT_SCAN_WINDOW bytes before touching the rest.
+# A header match ending within CONTACT_SCAN_OVERLAP of the window edge may be
+# cut short, so it is re-checked against the full text.
+CONTACT_SCAN_WINDOW = 2048
+CONTACT_SCAN_OVERLAP = 256  # Longer than any email/phone match
+# Hyperscan pattern ids: 0 is the email pattern, 1.. are _PHONE_RES in order
+_CONTACT_PATTERNS = (_EMAIL_RE,) + _PHONE_RES
+
+_POSSESSIVE_RE = re.compile(rb'(?<!\\)([?+*}])\+')
+
+_HTTP_PREFIXES = ("http://", "https://")
+
+# Runs the contact fallback scan while the Kundali (Ollama) request is in flight
+_contact_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="contact-scan")
+
+
+def _build_contact_hs_db():
+    """Compile all contact patterns into one Hyperscan database (None if unavailable)"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    try:
+        hs_db = hyperscan.Database()
+        hs_db.compile(
+            # Hyperscan has no possessive quantifiers (and never backtracks), so give it the plain form
+            expressions=[_POSSESSIVE_RE.sub(rb"\1", pattern.pattern) for pattern in _CONTACT_PATTERNS],
+            ids=list(range(len(_CONTACT_PATTERNS))),
+            elements=len(_CONTACT_PATTERNS),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_CONTACT_PATTERNS),
+        )
+        return hs_db
+    except Exception as e:
+        logger.warning("hyperscan_contact_db_compile_failed", error=str(e))
+        return None
+
+
+_CONTACT_HS_DB = _build_contact_hs_db()
+# Hyperscan scratch space must not be shared between concurrent scans (threads pool)
+_hs_local = threading.local()
 
 def _flatten_skills(skills_dict: Dict[str, Any]) -> List[str]:
     """Flatten skills dictionary to list"""
@@ -48,273 +136,671 @@ def _flatten_skills(skills_dict: Dict[str, Any]) -> List[str]:
     return []
 
 
-@celery_app.task(bind=True, max_retries=3, soft_time_limit=600, time_limit=900)
+# Resume processing runs as a chain of stages with different resource profiles.
+# Each stage is routed to its own queue (see task_routes in celery_app) so the
+# LLM stage can scale on GPU workers independently of PDF extraction and DB writes.
+# Seconds the extracted text handle lives between stages. Sized for a day-long gpu-ai
+# backlog rather than a typical run; the handle is deleted as soon as the resume is persisted
+RESUME_TEXT_TTL = 24 * 3600
+RESUME_STATUS_TTL = 900  # Seconds a live "processing" status is shown without a durable update
+RESUME_PARSE_CLAIM_TTL = 900  # parse_resume_task's hard time_limit; a killed worker's claim lapses with it
+RESUME_PARSER_VERSION = "3.0-ai-enhanced"  # Stored on ResumeVersion and part of the AI parse cache key
+AI_PARSE_CACHE_TTL = 30 * 24 * 3600  # 30 days
+PERSIST_BATCH_SIZE = 50  # Parsed resumes committed together by the batched persist stage
+PERSIST_BATCH_INTERVAL = 5  # Seconds before a partial batch is flushed
+
+
+def dispatch_resume_processing(resume_id: int, force_reprocess: bool = False, batched: bool = False, producer=None):
+    """
+    Run extraction -> parsing -> persistence for a resume as a Celery chain.
+    force_reprocess skips the content-addressed AI parse cache; batched routes
+    the persist stage through persist_resume_versions_batch (bulk uploads).
+    producer lets bulk callers publish many chains over one broker connection.
+    """
+    if batched and CELERY_BATCHES_AVAILABLE:
+        persist = persist_resume_versions_batch.s()
+    else:
+        persist = persist_resume_version_task.s()
+    return chain(
+        extract_resume_text_task.s(resume_id, force_reprocess),
+        parse_resume_task.s(),
+        persist,
+    ).apply_async(producer=producer)
+
+
+@celery_app.task(bind=True)
 def process_resume_task(self: Task, resume_id: int):
-    """Process a resume asynchronously"""
-    db: Session = SessionLocal()
+    """
+    Process a resume asynchronously.
+    Kept as the entry point for already-queued messages; the work itself runs
+    as the extract -> parse -> persist chain.
+    """
+    dispatch_resume_processing(resume_id)
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    retry_jitter=True,
+    max_retries=3,
+)
+def extract_resume_text_task(self: Task, resume_id: int, force_reprocess: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Stage 1: extract and validate the resume text.
+    Returns a small handle for the parse stage (the text itself goes through
+    Redis), or None when the resume was marked failed and the chain should stop.
+    """
+    log = logger.bind(resume_id=resume_id, task="extract_resume_text")
+    db: Session = TaskSession()
     try:
         resume = db.query(Resume).filter(Resume.id == resume_id).first()
         if not resume:
-            logger.error("resume_not_found", resume_id=resume_id)
-            return
+            log.error("resume_not_found")
+            return None
         
-        # Update status
-        resume.processing_status = "processing"
-        db.commit()
+        # Publish "processing" through Redis instead of a dedicated Postgres commit;
+        # the durable completed/failed status lands with the stage that finishes the resume
+        _set_live_status(resume_id, "processing")
         
         # Extract text
         try:
             raw_text = parser.extract_text(resume.file_path)
-            resume.raw_text = raw_text
+            resume_doc = ResumeDoc.from_text(raw_text)
         except Exception as e:
-            logger.error("text_extraction_failed", resume_id=resume_id, error=str(e))
+            log.error("text_extraction_failed", error=str(e))
             resume.processing_status = "failed"
             resume.processing_error = str(e)
             db.commit()
-            return
+            return None
         
         # Validate if document is actually a resume
-        is_valid_resume, validation_details = resume_validator.validate(raw_text)
+        is_valid_resume, validation_details = resume_validator.validate(resume_doc)
         if not is_valid_resume:
-            logger.warning("resume_validation_failed", 
-                         resume_id=resume_id, 
-                         score=validation_details.get('score', 0),
-                         reasons=validation_details.get('reasons', []))
+            log.warning("resume_validation_failed",
+                        score=validation_details.get('score', 0),
+                        reasons=validation_details.get('reasons', []))
+            resume.raw_text = raw_text  # Kept so rejected documents can be inspected
             resume.processing_status = "failed"
             resume.processing_error = f"Document does not appear to be a resume. Validation score: {validation_details.get('score', 0)}. Reasons: {', '.join(validation_details.get('reasons', []))}"
             db.commit()
-            return
+            return None
         
-        logger.info("resume_validation_passed", 
-                   resume_id=resume_id, 
-                   score=validation_details.get('score', 0))
+        log.info("resume_validation_passed", score=validation_details.get('score', 0))
+        
+        # raw_text reaches Postgres once, together with the parsed version; until
+        # then Redis carries it between stages. Only write it now if Redis is down.
+        if not _store_resume_text(resume_id, raw_text):
+            resume.raw_text = raw_text
+            db.commit()
+        return {"resume_id": resume_id, "file_path": resume.file_path, "force_reprocess": force_reprocess}
+        
+    except Exception as e:
+        _fail_resume(db, resume_id, e)
+        # Let autoretry_for decide whether this error is worth retrying
+        raise
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    retry_jitter=True,
+    max_retries=3,
+    soft_time_limit=600,
+    time_limit=900,
+)
+def parse_resume_task(self: Task, handle: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Stage 2: parse the extracted text (Kundali, then AI, then rule-based parser).
+    Does no database work on the happy path; returns the parsed data for the
+    persist stage, or None when every parser failed.
+    """
+    if handle is None:
+        return None
+    resume_id = handle["resume_id"]
+    pdf_path = handle["file_path"]
+    log = logger.bind(resume_id=resume_id, task="parse_resume")
+    
+    # Only one worker parses a given resume at a time; a duplicate message stops its chain
+    # here instead of paying for a second LLM parse. The claim is a Redis key, so no
+    # Postgres connection or transaction is held open through the LLM call.
+    claim_token = self.request.id or ""
+    if not _claim_resume_parse(resume_id, claim_token):
+        log.info("resume_already_processing")
+        return None
+    
+    try:
+        raw_text = _load_resume_text(resume_id, pdf_path)
+        resume_doc = ResumeDoc.from_text(raw_text)
         
         # Parse resume using Candidate Kundali Parser (v2.0 - Masterpiece Architecture)
         # Philosophy: Resume-as-Source-of-Truth, Image-First, Qwen Vision
-        try:
-            from app.resumes.kundali_parser import kundali_parser
-            from app.models.candidate_kundali import CandidateKundali
-            from app.models.candidate import Candidate
-            
-            logger.info("starting_kundali_parsing", resume_id=resume_id, pdf_path=resume.file_path)
-            
-            # Use Kundali Parser (Qwen Vision-based or text-based)
-            # Pass raw_text so text-only models can use it (better than PDF base64)
-            kundali_data = kundali_parser.parse_resume(resume.file_path, text_from_pdf=raw_text)
-            candidate_kundali = kundali_data.get("candidate_kundali", {})
-            
-            logger.info("kundali_parsing_complete", 
-                       resume_id=resume_id,
-                       confidence=candidate_kundali.get("overall_confidence_score", 0.0),
-                       has_experience=bool(candidate_kundali.get("experience")),
-                       has_personality=bool(candidate_kundali.get("personality_inference")))
-            
-            # Check if kundali parsing failed (Ollama not available or returned empty data)
-            name = candidate_kundali.get("identity", {}).get("name", "unknown")
-            confidence = candidate_kundali.get("overall_confidence_score", 0.0)
-            has_experience = bool(candidate_kundali.get("experience"))
-            has_skills = bool(candidate_kundali.get("skills", {}).get("frontend") or 
-                            candidate_kundali.get("skills", {}).get("backend") or
-                            candidate_kundali.get("skills", {}).get("tools"))
-            
-            # If kundali parsing failed (name is unknown, confidence is 0, no experience/skills), fall back to AI parser
-            if (name == "unknown" or name == "") and confidence == 0.0 and not has_experience and not has_skills:
-                logger.warning("kundali_parsing_returned_empty_data_falling_back_to_ai_parser", 
-                             resume_id=resume_id, 
-                             ollama_available=kundali_parser.ollama_available)
-                # Fall back to AI parser
-                raise ValueError("Kundali parser returned empty data - falling back to AI parser")
-            
-            # Convert Kundali to legacy parsed_data format (for backward compatibility)
-            parsed_data = _kundali_to_parsed_data(candidate_kundali, raw_text=raw_text)
-            parsed_data["_metadata"] = {
-                "parser_version": "kundali-v2.0",
-                "used_qwen_vision": kundali_parser.ollama_available and kundali_parser.use_vision,
-                "kundali_confidence": candidate_kundali.get("overall_confidence_score", 0.0)
-            }
-            
-            # Create/Update Candidate from Kundali
-            _create_candidate_from_kundali(db, resume_id, candidate_kundali, raw_text=raw_text)
-            
-        except ImportError:
-            # Fallback to legacy AI parser if Kundali parser not available
-            logger.warning("kundali_parser_not_available_fallback_to_legacy", resume_id=resume_id)
+        parsed_data: Optional[ParsedResume] = None
+        normalized: Optional[NormalizedKundali] = None
+        if _HAS_KUNDALI:
             try:
-                logger.info("starting_ai_resume_parsing", resume_id=resume_id, pdf_path=resume.file_path)
-                parsed_data = ai_parser.parse_with_ai(raw_text, pdf_path=resume.file_path, force_reprocess=True)
-                logger.info("ai_resume_parsing_complete", resume_id=resume_id, 
-                           parser_version=parsed_data.get("_metadata", {}).get("parser_version", "unknown"))
+                log.debug("starting_kundali_parsing", pdf_path=pdf_path)
+                
+                # Use Kundali Parser (Qwen Vision-based or text-based)
+                # Pass raw_text so text-only models can use it (better than PDF base64)
+                # Contact regex scan overlaps the LLM call (which releases the GIL on HTTP I/O)
+                contact_future = _contact_executor.submit(_extract_contact, raw_text.encode("utf-8"))
+                kundali_data = kundali_parser.parse_resume(pdf_path, text_from_pdf=resume_doc)
+                # Plain attributes set once when the parser is created; snapshot for this task
+                ollama_available = kundali_parser.ollama_available
+                candidate_kundali = kundali_data.get("candidate_kundali", {})
+                
+                log.debug("kundali_parsing_complete",
+                          confidence=candidate_kundali.get("overall_confidence_score", 0.0),
+                          has_experience=bool(candidate_kundali.get("experience")),
+                          has_personality=bool(candidate_kundali.get("personality_inference")))
+                
+                # Check if kundali parsing failed (Ollama not available or returned empty data)
+                name = candidate_kundali.get("identity", {}).get("name", "unknown")
+                confidence = candidate_kundali.get("overall_confidence_score", 0.0)
+                has_experience = bool(candidate_kundali.get("experience"))
+                has_skills = bool(candidate_kundali.get("skills", {}).get("frontend") or 
+                                candidate_kundali.get("skills", {}).get("backend") or
+                                candidate_kundali.get("skills", {}).get("tools"))
+                
+                # If kundali parsing failed (name is unknown, confidence is 0, no experience/skills), fall back to AI parser
+                if (name == "unknown" or name == "") and confidence == 0.0 and not has_experience and not has_skills:
+                    log.warning("kundali_parsing_returned_empty_data_falling_back_to_ai_parser",
+                                ollama_available=ollama_available)
+                    # Fall back to AI parser
+                    raise ValueError("Kundali parser returned empty data - falling back to AI parser")
+                
+                # Normalize name/contact/links/skills once for both consumers
+                normalized = _normalize_kundali(candidate_kundali, raw_text, contact_future)
+                
+                # Seniority needs the raw text, so it is assessed here rather than at persist time
+                _assess_seniority(candidate_kundali, raw_text)
+                
+                # Convert Kundali to legacy parsed_data format (for backward compatibility)
+                parsed_data = _kundali_to_parsed_data(candidate_kundali, normalized)
+                parsed_data["_metadata"] = {
+                    "parser_version": "kundali-v2.0",
+                    "used_qwen_vision": ollama_available and kundali_parser.use_vision,
+                    "kundali_confidence": candidate_kundali.get("overall_confidence_score", 0.0)
+                }
             except Exception as e:
-                logger.warning("ai_parsing_failed_fallback", resume_id=resume_id, error=str(e), exc_info=True)
-                # Fallback to rule-based parsing
-                try:
-                    parsed_data = parser.parse(raw_text)
-                    logger.info("fallback_parsing_success", resume_id=resume_id)
-                    # Calculate quality score for fallback parsing
-                    if "quality_score" not in parsed_data or parsed_data.get("quality_score") is None:
-                        # Use the already imported ai_parser instance
-                        quality_score = ai_parser._calculate_quality_score(parsed_data, raw_text)
-                        parsed_data["quality_score"] = quality_score
-                        logger.info("fallback_quality_score_calculated", resume_id=resume_id, score=quality_score)
-                except Exception as e2:
-                    logger.error("resume_parsing_failed", resume_id=resume_id, error=str(e2), exc_info=True)
-                    resume.processing_status = "failed"
-                    resume.processing_error = str(e2)
-                    db.commit()
-                    return
-        except Exception as e:
-            # Catch any other exceptions from the outer try block (kundali parser)
-            logger.error("kundali_parsing_failed_fallback", resume_id=resume_id, error=str(e), exc_info=True)
+                # Fallbacks are routine when Ollama is flaky - full tracebacks only at DEBUG
+                log.error("kundali_parsing_failed_fallback", error=str(e))
+                log.debug("kundali_parsing_failed_traceback", exc_info=True)
+                parsed_data = None
+                normalized = None
+        else:
+            log.warning("kundali_parser_not_available_fallback_to_legacy")
+        
+        if parsed_data is None:
             # Fallback to legacy AI parser
             try:
-                logger.info("starting_ai_resume_parsing", resume_id=resume_id, pdf_path=resume.file_path)
-                parsed_data = ai_parser.parse_with_ai(raw_text, pdf_path=resume.file_path, force_reprocess=True)
-                logger.info("ai_resume_parsing_complete", resume_id=resume_id, 
-                           parser_version=parsed_data.get("_metadata", {}).get("parser_version", "unknown"))
-            except Exception as e2:
-                logger.warning("ai_parsing_failed_fallback", resume_id=resume_id, error=str(e2), exc_info=True)
+                log.debug("starting_ai_resume_parsing", pdf_path=pdf_path)
+                # Content-addressed cache: retries and duplicate uploads skip the LLM entirely.
+                # Blank text would key every such resume to one shared entry, so it is never cached.
+                ai_cache_key = _ai_parse_cache_key(raw_text, pdf_path) if raw_text.strip() else None
+                parsed_data = get_cache(ai_cache_key) if ai_cache_key and not handle.get("force_reprocess") else None
+                if parsed_data:
+                    log.info("using_cached_ai_parse")
+                else:
+                    # ai_parser's own cache is keyed by a 200-char prefix, so always bypass it here
+                    parsed_data = ai_parser.parse_with_ai(resume_doc, pdf_path=pdf_path, force_reprocess=True)
+                    if ai_cache_key:
+                        set_cache(ai_cache_key, parsed_data, ttl=AI_PARSE_CACHE_TTL)
+                log.debug("ai_resume_parsing_complete",
+                          parser_version=parsed_data.get("_metadata", {}).get("parser_version", "unknown"))
+            except Exception as e:
+                log.warning("ai_parsing_failed_fallback", error=str(e))
+                log.debug("ai_parsing_failed_traceback", exc_info=True)
                 # Fallback to rule-based parsing
                 try:
                     parsed_data = parser.parse(raw_text)
-                    logger.info("fallback_parsing_success", resume_id=resume_id)
-                    # Calculate quality score for fallback parsing
-                    if "quality_score" not in parsed_data or parsed_data.get("quality_score") is None:
-                        quality_score = ai_parser._calculate_quality_score(parsed_data, raw_text)
-                        parsed_data["quality_score"] = quality_score
-                        logger.info("fallback_quality_score_calculated", resume_id=resume_id, score=quality_score)
-                except Exception as e3:
-                    logger.error("resume_parsing_failed", resume_id=resume_id, error=str(e3), exc_info=True)
-                    resume.processing_status = "failed"
-                    resume.processing_error = str(e3)
-                    db.commit()
-                    return
-        
-        # Mark old versions as not current
-        db.query(ResumeVersion).filter(
-            ResumeVersion.resume_id == resume_id,
-            ResumeVersion.is_current == True,
-        ).update({"is_current": False})
-        
-        # Create new version
-        latest_version = (
-            db.query(ResumeVersion)
-            .filter(ResumeVersion.resume_id == resume_id)
-            .order_by(ResumeVersion.version_number.desc())
-            .first()
-        )
-        version_number = (latest_version.version_number + 1) if latest_version else 1
+                    log.info("fallback_parsing_success")
+                    # Rule-based output has no quality score; it is filled in once below
+                except Exception as e2:
+                    log.error("resume_parsing_failed", error=str(e2), exc_info=True)
+                    db: Session = TaskSession()
+                    _mark_resume_failed(db, resume_id, str(e2))
+                    return None
         
-        # Get quality score from parsed data (should be calculated by parser)
-        quality_score = parsed_data.get("quality_score")
-        logger.info("quality_score_from_parsed_data", resume_id=resume_id, quality_score=quality_score)
-        if quality_score is None:
-            # Fallback: Calculate quality score if parser didn't provide it
-            logger.warning("quality_score_missing_from_parser", resume_id=resume_id)
-            # Use the already imported ai_parser instance
-            quality_score = ai_parser._calculate_quality_score(parsed_data, raw_text)
-            logger.info("quality_score_calculated_in_task", resume_id=resume_id, score=quality_score)
+        # Parsers normally provide the quality score; compute it only when missing
+        if parsed_data.get("quality_score") is None:
+            parsed_data["quality_score"] = _calc_quality(parsed_data, raw_text)
         
-        logger.info("final_quality_score", resume_id=resume_id, quality_score=quality_score, version=version_number)
+        return {
+            "resume_id": resume_id,
+            "parsed_data": parsed_data,
+            "normalized": asdict(normalized) if normalized is not None else None,
+        }
         
-        resume_version = ResumeVersion(
-            resume_id=resume_id,
-            version_number=version_number,
-            parsed_data=parsed_data,
-            skills=parsed_data.get("skills"),
-            experience_years=parsed_data.get("experience_years"),
-            education=parsed_data.get("education"),
-            experience=parsed_data.get("experience"),
-            projects=parsed_data.get("projects"),
-            certifications=parsed_data.get("certifications"),
-            languages=parsed_data.get("languages"),
-            is_current=True,
-            parser_version="3.0-ai-enhanced",  # Updated version for enhanced AI parsing
-            quality_score=quality_score,
-        )
-        db.add(resume_version)
-        
-        # Update resume status
-        resume.processing_status = "completed"
+    except Exception as e:
+        _fail_resume(TaskSession(), resume_id, e)
+        raise
+    finally:
+        _release_resume_parse(resume_id, claim_token)
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    retry_jitter=True,
+    max_retries=3,
+)
+def persist_resume_version_task(self: Task, result: Optional[Dict[str, Any]]):
+    """
+    Stage 3: write Candidate/Kundali (if parsed by Kundali), the new
+    ResumeVersion and the completed status in a single transaction.
+    """
+    if result is None:
+        return
+    resume_id = result["resume_id"]
+    
+    db: Session = TaskSession()
+    try:
+        version_number = _persist_resume_version(db, result)
+        if version_number is None:
+            return
+        # Single commit for candidate, Kundali, version and status
         db.commit()
+        _clear_resume_handles(resume_id)
         
         logger.info("resume_processed", resume_id=resume_id, version=version_number)
         
     except Exception as e:
-        logger.exception("resume_processing_error", resume_id=resume_id, error=str(e))
-        db.rollback()
-        
-        # Update resume status
-        resume = db.query(Resume).filter(Resume.id == resume_id).first()
-        if resume:
-            resume.processing_status = "failed"
-            resume.processing_error = str(e)
+        _fail_resume(db, resume_id, e)
+        raise
+
+
+if CELERY_BATCHES_AVAILABLE:
+    @celery_app.task(base=Batches, flush_every=PERSIST_BATCH_SIZE, flush_interval=PERSIST_BATCH_INTERVAL)
+    def persist_resume_versions_batch(requests):
+        """
+        Stage 3 for bulk ingest: persist up to PERSIST_BATCH_SIZE parsed resumes
+        in one transaction. Each resume gets its own savepoint, so one bad
+        resume is marked failed without discarding the rest of the batch.
+        """
+        db: Session = TaskSession()
+        done = []
+        try:
+            for request in requests:
+                result = request.args[0] if request.args else None
+                if result is None:
+                    done.append((request, None, None))
+                    continue
+                resume_id = result["resume_id"]
+                try:
+                    with db.begin_nested():
+                        version_number = _persist_resume_version(db, result)
+                except Exception as e:
+                    logger.exception("resume_processing_error", resume_id=resume_id, error=str(e))
+                    _mark_resume_failed(db, resume_id, str(e), commit=False)
+                    version_number = None
+                done.append((request, resume_id, version_number))
             db.commit()
+        except Exception as e:
+            logger.exception("resume_batch_persist_error", size=len(requests), error=str(e))
+            db.rollback()
+            for request in requests:
+                if request.args and request.args[0] is not None:
+                    _mark_resume_failed(db, request.args[0]["resume_id"], str(e))
+            raise
         
-        # Retry
-        raise self.retry(exc=e, countdown=60)
-    finally:
-        db.close()
+        for request, resume_id, version_number in done:
+            if version_number is not None:
+                _clear_resume_handles(resume_id)
+                logger.info("resume_processed", resume_id=resume_id, version=version_number)
+            celery_app.backend.mark_as_done(request.id, version_number, request=request)
+        logger.info("resume_batch_persisted", size=len(requests))
 
 
-def _kundali_to_parsed_data(kundali: Dict[str, Any], raw_text: str = None) -> Dict[str, Any]:
-    """Convert Candidate Kundali to legacy parsed_data format"""
+_JSON_VERSION_COLUMNS = ("skills", "education", "experience", "projects", "certifications", "languages")
+_INSERT_NEXT_VERSION_SQL = text("""
+    WITH demoted AS (
+        UPDATE resume_versions SET is_current = false
+        WHERE resume_id = :resume_id AND is_current
+    )
+    INSERT INTO resume_versions (
+        resume_id, version_number, parsed_data, skills, experience_years, education,
+        experience, projects, certifications, languages, is_current, parser_version, quality_score
+    )
+    SELECT :resume_id, COALESCE(MAX(version_number), 0) + 1, :parsed_data, :skills, :experience_years,
+           :education, :experience, :projects, :certifications, :languages, true, :parser_version,
+           :quality_score
+    FROM resume_versions
+    WHERE resume_id = :resume_id
+    RETURNING version_number
+""").bindparams(
+    bindparam("parsed_data", type_=JSONB),
+    *(bindparam(column, type_=JSON) for column in _JSON_VERSION_COLUMNS),
+)
+
+# Transaction-scoped advisory lock keyed per resume; released on commit/rollback
+_LOCK_RESUME_SQL = text("SELECT pg_advisory_xact_lock(hashtextextended('resume:' || :resume_id, 0))")
+
+
+def _persist_resume_version(db: Session, result: Dict[str, Any]) -> Optional[int]:
+    """
+    Write Candidate/Kundali and the next ResumeVersion for one parsed resume and
+    mark it completed. The caller commits. Returns the new version number, or
+    None if the resume no longer exists.
+    """
+    resume_id = result["resume_id"]
+    parsed_data = result["parsed_data"]
+    
+    # Serialize version writes for the same resume (MAX(version_number) + 1 is not race-free)
+    db.execute(_LOCK_RESUME_SQL, {"resume_id": resume_id})
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    if not resume:
+        logger.error("resume_not_found", resume_id=resume_id)
+        return None
+    
+    # Create/Update Candidate from Kundali
+    if result["normalized"] is not None:
+        _create_candidate_from_kundali(
+            db, resume_id, parsed_data["_kundali"], NormalizedKundali(**result["normalized"])
+        )
+    
+    # Demote the current version and insert the next one in a single statement;
+    # the version number is computed server-side and returned for logging
+    quality_score = parsed_data.get("quality_score")
+    version_number = db.execute(
+        _INSERT_NEXT_VERSION_SQL,
+        {
+            "resume_id": resume_id,
+            "parsed_data": parsed_data,
+            "skills": parsed_data.get("skills"),
+            "experience_years": parsed_data.get("experience_years"),
+            "education": parsed_data.get("education"),
+            "experience": parsed_data.get("experience"),
+            "projects": parsed_data.get("projects"),
+            "certifications": parsed_data.get("certifications"),
+            "languages": parsed_data.get("languages"),
+            "parser_version": RESUME_PARSER_VERSION,
+            "quality_score": quality_score,
+        },
+    ).scalar_one()
+    logger.info("final_quality_score", resume_id=resume_id, quality_score=quality_score, version=version_number)
+    
+    # First (and only) write of the extracted text, unless Redis was unavailable
+    raw_text = _get_cached_resume_text(resume_id)
+    if raw_text is not None:
+        resume.raw_text = raw_text
+    resume.processing_status = "completed"
+    return version_number
+
+
+def _fail_resume(db: Session, resume_id: int, error: Exception) -> None:
+    """Roll back a stage's work and mark the resume failed"""
+    logger.exception("resume_processing_error", resume_id=resume_id, error=str(error))
+    db.rollback()
+    _mark_resume_failed(db, resume_id, str(error))
+
+
+def _mark_resume_failed(db: Session, resume_id: int, error: str, commit: bool = True) -> None:
+    """Record a processing failure on the resume row"""
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    if resume:
+        resume.processing_status = "failed"
+        resume.processing_error = error
+        if commit:
+            db.commit()
+
+
+def _ai_parse_cache_key(raw_text: str, pdf_path: Optional[str]) -> str:
+    """Cache key over the full resume text and the parser configuration"""
+    digest = hashlib.sha256(f"{RESUME_PARSER_VERSION}|{bool(pdf_path)}|".encode() + raw_text.encode("utf-8"))
+    return get_cache_key("ai_parse", "sha256", digest.hexdigest())
+
+
+def _resume_text_key(resume_id: int) -> str:
+    return get_cache_key("resume_text", resume_id)
+
+
+def _resume_status_key(resume_id: int) -> str:
+    return get_cache_key("resume", resume_id, "status")
+
+
+def _set_live_status(resume_id: int, status: str) -> None:
+    """Publish a transient processing status for the UI to poll"""
+    try:
+        redis_client.set(_resume_status_key(resume_id), status, ex=RESUME_STATUS_TTL)
+    except Exception as e:
+        logger.warning("resume_status_cache_set_failed", resume_id=resume_id, error=str(e))
+
+
+def _resume_parse_claim_key(resume_id: int) -> str:
+    return get_cache_key("resume", resume_id, "parse_claim")
+
+
+# Delete the claim only if this task still owns it (it may have expired and been re-claimed)
+_RELEASE_CLAIM_SCRIPT = redis_client.register_script(
+    "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+)
+
+
+def _claim_resume_parse(resume_id: int, token: str) -> bool:
+    """Claim the parse of a resume for this task (SET NX EX); False if another task holds it"""
+    try:
+        return bool(redis_client.set(_resume_parse_claim_key(resume_id), token, nx=True, ex=RESUME_PARSE_CLAIM_TTL))
+    except Exception as e:
+        # The claim only deduplicates parses; the persist stage still serializes version writes
+        logger.warning("resume_parse_claim_failed", resume_id=resume_id, error=str(e))
+        return True
+
+
+def _release_resume_parse(resume_id: int, token: str) -> None:
+    """Release this task's parse claim"""
+    try:
+        _RELEASE_CLAIM_SCRIPT(keys=[_resume_parse_claim_key(resume_id)], args=[token])
+    except Exception as e:
+        logger.warning("resume_parse_claim_release_failed", resume_id=resume_id, error=str(e))
+
+
+def _clear_resume_handles(resume_id: int) -> None:
+    """Drop the Redis text handle and live status once the resume is persisted"""
+    try:
+        redis_client.delete(_resume_text_key(resume_id), _resume_status_key(resume_id))
+    except Exception as e:
+        logger.warning("resume_handles_delete_failed", resume_id=resume_id, error=str(e))
+
+
+def resolve_processing_statuses(resumes: List[Resume]) -> Dict[int, str]:
+    """
+    Effective processing status per resume id. Postgres holds the durable
+    pending/completed/failed states; a pending resume that a worker has picked
+    up is reported as "processing" from its live Redis status.
+    """
+    statuses = {resume.id: resume.processing_status for resume in resumes}
+    pending = [resume.id for resume in resumes if resume.processing_status == "pending"]
+    if pending:
+        try:
+            live = redis_client.mget([_resume_status_key(resume_id) for resume_id in pending])
+        except Exception as e:
+            logger.warning("resume_status_cache_get_failed", error=str(e))
+            live = []
+        for resume_id, status in zip(pending, live):
+            if status:
+                statuses[resume_id] = status
+    return statuses
+
+
+def _store_resume_text(resume_id: int, raw_text: str) -> bool:
+    """Hand the extracted text to the next stages through Redis"""
+    try:
+        redis_client.setex(_resume_text_key(resume_id), RESUME_TEXT_TTL, raw_text)
+        return True
+    except Exception as e:
+        # The caller stores it on the resume row instead, where later stages fall back to
+        logger.warning("resume_text_cache_set_failed", resume_id=resume_id, error=str(e))
+        return False
+
+
+def _get_cached_resume_text(resume_id: int) -> Optional[str]:
+    """Fetch the extracted text from Redis (None on miss or error)"""
+    try:
+        return redis_client.get(_resume_text_key(resume_id))
+    except Exception as e:
+        logger.warning("resume_text_cache_get_failed", resume_id=resume_id, error=str(e))
+        return None
+
+
+def _load_resume_text(resume_id: int, pdf_path: str) -> str:
+    """
+    Fetch the extracted text from Redis, falling back to resumes.raw_text.
+    If neither has it (the handle expired while the chain was queued), extract
+    the file again rather than parse an empty document.
+    """
+    raw_text = _get_cached_resume_text(resume_id)
+    if raw_text:
+        return raw_text
+    db: Session = TaskSession()
+    raw_text = db.query(Resume.raw_text).filter(Resume.id == resume_id).scalar()
+    # End the read transaction so it is not left open through the LLM parse
+    db.rollback()
+    if raw_text:
+        return raw_text
+    
+    logger.warning("resume_text_handle_missing_reextracting", resume_id=resume_id)
+    raw_text = parser.extract_text(pdf_path)
+    if not raw_text or not raw_text.strip():
+        raise ValueError(f"No text available for resume {resume_id}: text handle expired and re-extraction was empty")
+    # The persist stage reads the handle too; fall back to the row as the extract stage does
+    if not _store_resume_text(resume_id, raw_text):
+        db.query(Resume).filter(Resume.id == resume_id).update({Resume.raw_text: raw_text}, synchronize_session=False)
+        db.commit()
+    return raw_text
+
+
+@dataclass(slots=True)
+class NormalizedKundali:
+    """Identity, contact, link and skill fields derived once from a Kundali"""
+    name: str
+    name_first: str
+    name_last: str
+    email: str
+    phone: str
+    linkedin_urls: List[str] = field(default_factory=list)
+    github_urls: List[str] = field(default_factory=list)
+    portfolio_urls: List[str] = field(default_factory=list)
+    other_links: List[str] = field(default_factory=list)
+    all_skills: List[str] = field(default_factory=list)
+
+
+def _normalize_kundali(
+    kundali: Dict[str, Any],
+    raw_text: Optional[str] = None,
+    contact_future: Optional["Future[Tuple[str, str]]"] = None,
+) -> NormalizedKundali:
+    """
+    Split the name, apply the regex email/phone fallback and normalize link lists
+    once, so the parsed_data conversion and Candidate creation share the result.
+    contact_future, if given, is a pending _extract_contact scan of raw_text.
+    """
     identity = kundali.get("identity", {})
     online_presence = kundali.get("online_presence", {})
     skills = kundali.get("skills", {})
     
-    # Split name into first_name and last_name
     name = identity.get("name", "unknown")
-    name_parts = name.split(" ", 1) if name and name != "unknown" else ["unknown", ""]
-    first_name = name_parts[0] if name_parts else "unknown"
-    last_name = name_parts[1] if len(name_parts) > 1 else ""
+    name_first, name_last = _split_name(name)
     
-    # Extract email - use fallback if AI missed it
+    # Extract email/phone - use fallback if AI missed them
     email = identity.get("email", "unknown")
-    if email == "unknown" and raw_text:
-        email = _extract_email_from_text(raw_text)
-        logger.info("email_extracted_from_text_fallback", email=email if email != "unknown" else None)
-    
-    # Extract phone - use fallback if AI missed it
     phone = identity.get("phone", "unknown")
-    if phone == "unknown" and raw_text:
-        phone = _extract_phone_from_text(raw_text)
-        logger.info("phone_extracted_from_text_fallback", phone=phone if phone != "unknown" else None)
+    if (email == "unknown" or phone == "unknown") and raw_text:
+        if contact_future is not None:
+            text_email, text_phone = contact_future.result()
+        else:
+            text_email, text_phone = _extract_contact(raw_text.encode("utf-8"))
+        if email == "unknown":
+            email = text_email
+            logger.info("email_extracted_from_text_fallback", email=email if email != "unknown" else None)
+            if email != "unknown":
+                # Update identity dict so it's also saved in Kundali
+                identity["email"] = email
+        if phone == "unknown":
+            phone = text_phone
+            logger.info("phone_extracted_from_text_fallback", phone=phone if phone != "unknown" else None)
+            if phone != "unknown":
+                identity["phone"] = phone
     
-    # Get links - take first one for legacy format, but keep all in kundali
-    linkedin_urls = online_presence.get("linkedin", [])
-    github_urls = online_presence.get("github", [])
-    portfolio_urls = online_presence.get("portfolio", [])
+    # Convert skills dict to list format (kept as a list - it is stored in the JSON column)
+    all_skills = list(itertools.chain.from_iterable(v for v in skills.values() if isinstance(v, list)))
     
-    # Normalize URLs (add https:// if missing)
-    def normalize_url(url):
-        if not url or url == "unknown":
-            return None
-        if isinstance(url, str) and not url.startswith(("http://", "https://")):
-            return f"https://{url}"
-        return url
+    return NormalizedKundali(
+        name=name,
+        name_first=name_first,
+        name_last=name_last,
+        email=email,
+        phone=phone,
+        linkedin_urls=_normalize_url_list(online_presence.get("linkedin")),
+        github_urls=_normalize_url_list(online_presence.get("github")),
+        portfolio_urls=_normalize_url_list(online_presence.get("portfolio")),
+        other_links=_normalize_url_list(online_presence.get("other_links")),
+        all_skills=all_skills,
+    )
+
+
+class ParsedResume(TypedDict, total=False):
+    """Legacy parsed_data shape stored in ResumeVersion.parsed_data"""
+    name: str
+    first_name: str
+    last_name: str
+    email: Optional[str]
+    phone: Optional[str]
+    linkedin_url: Optional[str]
+    github_url: Optional[str]
+    portfolio_url: Optional[str]
+    contact: Dict[str, Any]
+    experience: List[Dict[str, Any]]
+    education: List[Dict[str, Any]]
+    projects: List[Dict[str, Any]]
+    skills: Dict[str, List[str]]
+    certifications: List[Any]
+    languages: List[Any]
+    experience_years: Optional[int]
+    quality_score: Optional[int]
+    _kundali: Dict[str, Any]
+    _metadata: Dict[str, Any]
+
+
+def _split_name(name: Optional[str]) -> Tuple[str, str]:
+    """Split a full name into (first_name, last_name) on the first space"""
+    if not name or name == "unknown":
+        return "unknown", ""
+    first, _, last = name.partition(" ")
+    return first, last
+
+
+def _kundali_to_parsed_data(kundali: Dict[str, Any], normalized: NormalizedKundali) -> ParsedResume:
+    """Convert Candidate Kundali to legacy parsed_data format"""
+    identity = kundali.get("identity", {})
+    skills = kundali.get("skills", {})
     
-    linkedin = normalize_url(linkedin_urls[0]) if linkedin_urls else None
-    github = normalize_url(github_urls[0]) if github_urls else None
-    portfolio = normalize_url(portfolio_urls[0]) if portfolio_urls else None
+    email = normalized.email if normalized.email != "unknown" else None
+    phone = normalized.phone if normalized.phone != "unknown" else None
     
-    # Convert skills dict to list format
-    all_skills = []
-    for category, skill_list in skills.items():
-        if isinstance(skill_list, list):
-            all_skills.extend(skill_list)
+    # Get links - take first one for legacy format, but keep all in kundali
+    linkedin = normalized.linkedin_urls[0] if normalized.linkedin_urls else None
+    github = normalized.github_urls[0] if normalized.github_urls else None
+    portfolio = normalized.portfolio_urls[0] if normalized.portfolio_urls else None
     
     return {
-        "name": name,
-        "first_name": first_name,
-        "last_name": last_name,
-        "email": email if email != "unknown" else None,
-        "phone": phone if phone != "unknown" else None,
+        "name": normalized.name,
+        "first_name": normalized.name_first,
+        "last_name": normalized.name_last,
+        "email": email,
+        "phone": phone,
         "linkedin_url": linkedin,
         "github_url": github,
         "portfolio_url": portfolio,
         "contact": {
-            "email": email if email != "unknown" else None,
-            "phone": phone if phone != "unknown" else None,
+            "email": email,
+            "phone": phone,
             "location": identity.get("location", "unknown"),
             "linkedin": linkedin,
             "github": github,
@@ -324,7 +810,7 @@ def _kundali_to_parsed_data(kundali: Dict[str, Any], raw_text: str = None) -> Di
         "education": kundali.get("education", []),
         "projects": kundali.get("projects", []),
         "skills": {
-            "technical": all_skills,
+            "technical": normalized.all_skills,
             "languages": skills.get("soft_skills", []),
             "tools": skills.get("tools", []),
             "frameworks": []
@@ -338,63 +824,88 @@ def _kundali_to_parsed_data(kundali: Dict[str, Any], raw_text: str = None) -> Di
     }
 
 
-def _normalize_url(url):
-    """Normalize URL - add https:// if missing, handle None/unknown"""
-    if not url or url == "unknown":
-        return None
-    if isinstance(url, str):
-        # Remove any whitespace
-        url = url.strip()
-        # Add https:// if missing
-        if url and not url.startswith(("http://", "https://")):
-            return f"https://{url}"
-    return url
-
-
-def _extract_email_from_text(text: str) -> str:
-    """Extract email address from text using regex (fallback if AI misses it)"""
-    if not text:
-        return "unknown"
-    
-    # Common email regex pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(email_pattern, text)
-    
-    if matches:
-        # Return first valid email found
-        return matches[0]
-    return "unknown"
-
-
-def _extract_phone_from_text(text: str) -> str:
-    """Extract phone number from text using regex (fallback if AI misses it)"""
-    if not text:
-        return "unknown"
-    
-    # Common phone patterns: (123) 456-7890, 123-456-7890, +1-123-456-7890, etc.
-    phone_patterns = [
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890 or 123-456-7890
-        r'\+?\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-123-456-7890
-        r'\d{10}',  # 1234567890
+def _normalize_url_list(urls: Optional[List[Any]]) -> List[str]:
+    """Normalize a list of URLs - add https:// if missing, drop None/unknown entries"""
+    if not urls:
+        return []
+    return [
+        url if url.startswith(_HTTP_PREFIXES) else f"https://{url}"
+        for url in urls
+        if url and url != "unknown" and isinstance(url, str)
     ]
+
+
+def _contact_match_starts(data: bytes) -> Optional[Dict[int, int]]:
+    """
+    Find the leftmost match start of every contact pattern in one Hyperscan pass.
+    Returns {pattern_id: byte offset} or None when Hyperscan is unavailable.
+    """
+    if _CONTACT_HS_DB is None:
+        return None
+    
+    starts: Dict[int, int] = {}
+    
+    def on_match(pattern_id, start, end, flags, context):
+        if start < starts.get(pattern_id, start + 1):
+            starts[pattern_id] = start
     
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            return matches[0]
-    return "unknown"
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_CONTACT_HS_DB)
+    _CONTACT_HS_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+    return starts
 
 
-def _create_candidate_from_kundali(db: Session, resume_id: int, kundali: Dict[str, Any], raw_text: str = None):
-    """Create or update Candidate and CandidateKundali from Kundali data"""
-    from app.models.candidate import Candidate
-    from app.models.candidate_kundali import CandidateKundali
+def _search_header_first(pattern: "re.Pattern", data: bytes):
+    """Search the resume header window first, scanning the remainder only if needed"""
+    if len(data) <= CONTACT_SCAN_WINDOW:
+        return pattern.search(data)
     
-    identity = kundali.get("identity", {})
-    online_presence = kundali.get("online_presence", {})
-    skills = kundali.get("skills", {})
-    personality = kundali.get("personality_inference", {})
+    match = pattern.search(data, 0, CONTACT_SCAN_WINDOW)
+    boundary = CONTACT_SCAN_WINDOW - CONTACT_SCAN_OVERLAP
+    if match and match.end() <= boundary:
+        return match
+    # Resume from the overlap region so matches straddling the window edge are found whole
+    return pattern.search(data, min(match.start(), boundary) if match else boundary)
+
+
+def _search_contact_pattern(pattern_id: int, data: bytes, starts: Optional[Dict[int, int]]):
+    """Run the Python regex for a contact pattern, starting at the Hyperscan offset if known"""
+    if starts is None:
+        return _search_header_first(_CONTACT_PATTERNS[pattern_id], data)
+    if pattern_id not in starts:
+        return None
+    return _CONTACT_PATTERNS[pattern_id].search(data, starts[pattern_id])
+
+
+@lru_cache(maxsize=32)
+def _extract_contact(data: bytes) -> Tuple[str, str]:
+    """
+    Extract (email, phone) from UTF-8 resume text using regex (fallback if AI misses them).
+    Both fields share a single Hyperscan pass when available, and the result is
+    cached so every consumer of the same resume text reuses it.
+    """
+    if not data:
+        return "unknown", "unknown"
+    
+    starts = _contact_match_starts(data)
     
+    # Return first valid email found
+    match = _search_contact_pattern(0, data, starts)
+    email = match.group(0).decode("ascii") if match else "unknown"
+    
+    phone = "unknown"
+    for pattern_id in range(1, len(_CONTACT_PATTERNS)):
+        match = _search_contact_pattern(pattern_id, data, starts)
+        if match:
+            phone = match.group(0).decode("ascii")
+            break
+    
+    return email, phone
+
+
+def _assess_seniority(kundali: Dict[str, Any], raw_text: Optional[str] = None) -> Dict[str, Any]:
+    """Run the elite seniority analysis and record it (and its red flags) on the Kundali"""
     # Use elite seniority analyzer for world-class detection (never returns unknown)
     seniority_analysis = elite_seniority_analyzer.analyze_seniority(
         resume_data={
@@ -426,146 +937,135 @@ def _create_candidate_from_kundali(db: Session, resume_id: int, kundali: Dict[st
     seniority_red_flags = [rf.get("description", "") for rf in seniority.get("red_flags", [])]
     kundali["red_flags"] = list(set(existing_red_flags + seniority_red_flags))  # Merge and deduplicate
     
-    # Extract email with fallback to regex if AI missed it
-    email = identity.get("email", "unknown")
-    if email == "unknown" and raw_text:
-        email = _extract_email_from_text(raw_text)
-        if email != "unknown":
-            logger.info("email_extracted_from_text_fallback_in_candidate", email=email, resume_id=resume_id)
-            # Update identity dict so it's also saved in Kundali
-            identity["email"] = email
-    
-    # Extract phone with fallback to regex if AI missed it
-    phone = identity.get("phone", "unknown")
-    if phone == "unknown" and raw_text:
-        phone = _extract_phone_from_text(raw_text)
-        if phone != "unknown":
-            logger.info("phone_extracted_from_text_fallback_in_candidate", phone=phone, resume_id=resume_id)
-            # Update identity dict so it's also saved in Kundali
-            identity["phone"] = phone
+    return seniority
+
+
+def _create_candidate_from_kundali(
+    db: Session,
+    resume_id: int,
+    kundali: Dict[str, Any],
+    normalized: NormalizedKundali,
+):
+    """Create or update Candidate and CandidateKundali from Kundali data"""
+    # Assessed by the parse stage (see _assess_seniority)
+    seniority = kundali.get("seniority_assessment", {})
+    
+    email = normalized.email
+    phone = normalized.phone
     
     # Find or create Candidate
     candidate = db.query(Candidate).filter(Candidate.resume_id == resume_id).first()
     if not candidate:
-        # Extract name
-        name = identity.get("name", "unknown")
-        name_parts = name.split(" ", 1) if name and name != "unknown" else ["unknown", ""]
-        
         # Get first link from each category (for Candidate model - single URL fields)
-        linkedin_urls = online_presence.get("linkedin", [])
-        portfolio_urls = online_presence.get("portfolio", [])
-        
         candidate = Candidate(
             resume_id=resume_id,
-            first_name=name_parts[0] if name_parts else "unknown",
-            last_name=name_parts[1] if len(name_parts) > 1 else "",
+            first_name=normalized.name_first,
+            last_name=normalized.name_last,
             email=email if email != "unknown" else None,
             phone=phone if phone != "unknown" else None,
-            linkedin_url=_normalize_url(linkedin_urls[0]) if linkedin_urls else None,
-            portfolio_url=_normalize_url(portfolio_urls[0]) if portfolio_urls else None,
+            linkedin_url=normalized.linkedin_urls[0] if normalized.linkedin_urls else None,
+            portfolio_url=normalized.portfolio_urls[0] if normalized.portfolio_urls else None,
         )
         db.add(candidate)
         db.flush()  # Get candidate.id
     else:
-        # Update existing candidate
-        name = identity.get("name", "unknown")
-        if name and name != "unknown":
-            name_parts = name.split(" ", 1)
-            candidate.first_name = name_parts[0] if name_parts else candidate.first_name
-            candidate.last_name = name_parts[1] if len(name_parts) > 1 else candidate.last_name
+        # Update existing candidate - collect new values, write only what changed
+        candidate_values = {}
+        if normalized.name and normalized.name != "unknown":
+            candidate_values["first_name"] = normalized.name_first
+            candidate_values["last_name"] = normalized.name_last or candidate.last_name
         
         if email and email != "unknown":
-            candidate.email = email
+            candidate_values["email"] = email
         
         if phone and phone != "unknown":
-            candidate.phone = phone
+            candidate_values["phone"] = phone
+        
+        if normalized.linkedin_urls:
+            candidate_values["linkedin_url"] = normalized.linkedin_urls[0]
         
-        linkedin_urls = online_presence.get("linkedin", [])
-        if linkedin_urls:
-            candidate.linkedin_url = _normalize_url(linkedin_urls[0])
+        if normalized.portfolio_urls:
+            candidate_values["portfolio_url"] = normalized.portfolio_urls[0]
         
-        portfolio_urls = online_presence.get("portfolio", [])
-        if portfolio_urls:
-            candidate.portfolio_url = _normalize_url(portfolio_urls[0])
+        _update_changed_columns(db, candidate, candidate_values)
     
     # Create or update CandidateKundali
     kundali_record = db.query(CandidateKundali).filter(CandidateKundali.candidate_id == candidate.id).first()
+    kundali_values = _build_kundali_values(kundali, normalized, seniority, current=kundali_record)
     if not kundali_record:
-        kundali_record = CandidateKundali(
-            candidate_id=candidate.id,
-            name=identity.get("name", "unknown"),
-            email=email if email != "unknown" else "unknown",
-            phone=phone if phone != "unknown" else "unknown",
-            location=identity.get("location", "unknown"),
-            portfolio_urls=[_normalize_url(url) for url in online_presence.get("portfolio", []) if url and url != "unknown"],
-            github_urls=[_normalize_url(url) for url in online_presence.get("github", []) if url and url != "unknown"],
-            linkedin_urls=[_normalize_url(url) for url in online_presence.get("linkedin", []) if url and url != "unknown"],
-            other_links=[_normalize_url(url) for url in online_presence.get("other_links", []) if url and url != "unknown"],
-            summary=kundali.get("summary", ""),
-            total_experience_years=kundali.get("total_experience_years", 0),
-            experience_data=kundali.get("experience", []),
-            education_data=kundali.get("education", []),
-            projects_data=kundali.get("projects", []),
-            skills_frontend=skills.get("frontend", []),
-            skills_backend=skills.get("backend", []),
-            skills_data=skills.get("data", []),
-            skills_devops=skills.get("devops", []),
-            skills_ai_ml=skills.get("ai_ml", []),
-            skills_tools=skills.get("tools", []),
-            skills_soft=skills.get("soft_skills", []),
-            certifications_data=kundali.get("certifications", []),
-            languages=kundali.get("languages", []),
-            seniority_level=seniority.get("level", "mid"),  # Never unknown - default to mid
-            seniority_confidence=seniority.get("confidence", 0.0),
-            seniority_evidence=seniority.get("evidence", []),
-            work_style=personality.get("work_style", "unknown"),
-            ownership_level=personality.get("ownership_level", "unknown"),
-            learning_orientation=personality.get("learning_orientation", "unknown"),
-            communication_strength=personality.get("communication_strength", "unknown"),
-            risk_profile=personality.get("risk_profile", "unknown"),
-            personality_confidence=personality.get("confidence", 0.0),
-            leadership_signals=kundali.get("leadership_signals", []),
-            red_flags=kundali.get("red_flags", []),
-            overall_confidence_score=kundali.get("overall_confidence_score", 0.0),
-        )
+        kundali_record = CandidateKundali(candidate_id=candidate.id, **kundali_values)
         db.add(kundali_record)
     else:
-        # Update existing Kundali
-        kundali_record.name = identity.get("name", kundali_record.name)
-        kundali_record.email = email if email != "unknown" else kundali_record.email
-        kundali_record.phone = phone if phone != "unknown" else kundali_record.phone
-        kundali_record.location = identity.get("location", kundali_record.location)
-        kundali_record.portfolio_urls = [_normalize_url(url) for url in online_presence.get("portfolio", []) if url and url != "unknown"]
-        kundali_record.github_urls = [_normalize_url(url) for url in online_presence.get("github", []) if url and url != "unknown"]
-        kundali_record.linkedin_urls = [_normalize_url(url) for url in online_presence.get("linkedin", []) if url and url != "unknown"]
-        kundali_record.other_links = [_normalize_url(url) for url in online_presence.get("other_links", []) if url and url != "unknown"]
-        kundali_record.summary = kundali.get("summary", kundali_record.summary)
-        kundali_record.total_experience_years = kundali.get("total_experience_years", kundali_record.total_experience_years)
-        kundali_record.experience_data = kundali.get("experience", [])
-        kundali_record.education_data = kundali.get("education", [])
-        kundali_record.projects_data = kundali.get("projects", [])
-        kundali_record.skills_frontend = skills.get("frontend", [])
-        kundali_record.skills_backend = skills.get("backend", [])
-        kundali_record.skills_data = skills.get("data", [])
-        kundali_record.skills_devops = skills.get("devops", [])
-        kundali_record.skills_ai_ml = skills.get("ai_ml", [])
-        kundali_record.skills_tools = skills.get("tools", [])
-        kundali_record.skills_soft = skills.get("soft_skills", [])
-        kundali_record.certifications_data = kundali.get("certifications", [])
-        kundali_record.languages = kundali.get("languages", [])
-        kundali_record.seniority_level = seniority.get("level", "mid") if seniority.get("level") != "unknown" else "mid"  # Never unknown
-        kundali_record.seniority_confidence = seniority.get("confidence", kundali_record.seniority_confidence)
-        kundali_record.seniority_evidence = seniority.get("evidence", [])
-        kundali_record.work_style = personality.get("work_style", kundali_record.work_style)
-        kundali_record.ownership_level = personality.get("ownership_level", kundali_record.ownership_level)
-        kundali_record.learning_orientation = personality.get("learning_orientation", kundali_record.learning_orientation)
-        kundali_record.communication_strength = personality.get("communication_strength", kundali_record.communication_strength)
-        kundali_record.risk_profile = personality.get("risk_profile", kundali_record.risk_profile)
-        kundali_record.personality_confidence = personality.get("confidence", kundali_record.personality_confidence)
-        kundali_record.leadership_signals = kundali.get("leadership_signals", [])
-        kundali_record.red_flags = kundali.get("red_flags", [])
-        kundali_record.overall_confidence_score = kundali.get("overall_confidence_score", kundali_record.overall_confidence_score)
-    
-    db.commit()
+        _update_changed_columns(db, kundali_record, kundali_values)
+    
+    # No commit here - persist_resume_version_task commits candidate, Kundali and version together
+    db.flush()
     logger.info("candidate_kundali_created", candidate_id=candidate.id, resume_id=resume_id)
 
+
+
+def _build_kundali_values(
+    kundali: Dict[str, Any],
+    normalized: NormalizedKundali,
+    seniority: Dict[str, Any],
+    current: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Build CandidateKundali column values from Kundali data.
+    When updating an existing record, fields missing from the new Kundali keep
+    their current value instead of being reset to defaults.
+    """
+    identity = kundali.get("identity", {})
+    skills = kundali.get("skills", {})
+    personality = kundali.get("personality_inference", {})
+    
+    def fallback(column: str, default: Any) -> Any:
+        return getattr(current, column) if current is not None else default
+    
+    level = seniority.get("level", "mid")
+    
+    return {
+        "name": identity.get("name", fallback("name", "unknown")),
+        "email": normalized.email if normalized.email != "unknown" else fallback("email", "unknown"),
+        "phone": normalized.phone if normalized.phone != "unknown" else fallback("phone", "unknown"),
+        "location": identity.get("location", fallback("location", "unknown")),
+        "portfolio_urls": normalized.portfolio_urls,
+        "github_urls": normalized.github_urls,
+        "linkedin_urls": normalized.linkedin_urls,
+        "other_links": normalized.other_links,
+        "summary": kundali.get("summary", fallback("summary", "")),
+        "total_experience_years": kundali.get("total_experience_years", fallback("total_experience_years", 0)),
+        "experience_data": kundali.get("experience", []),
+        "education_data": kundali.get("education", []),
+        "projects_data": kundali.get("projects", []),
+        "skills_frontend": skills.get("frontend", []),
+        "skills_backend": skills.get("backend", []),
+        "skills_data": skills.get("data", []),
+        "skills_devops": skills.get("devops", []),
+        "skills_ai_ml": skills.get("ai_ml", []),
+        "skills_tools": skills.get("tools", []),
+        "skills_soft": skills.get("soft_skills", []),
+        "certifications_data": kundali.get("certifications", []),
+        "languages": kundali.get("languages", []),
+        "seniority_level": level if level != "unknown" else "mid",  # Never unknown - default to mid
+        "seniority_confidence": seniority.get("confidence", fallback("seniority_confidence", 0.0)),
+        "seniority_evidence": seniority.get("evidence", []),
+        "work_style": personality.get("work_style", fallback("work_style", "unknown")),
+        "ownership_level": personality.get("ownership_level", fallback("ownership_level", "unknown")),
+        "learning_orientation": personality.get("learning_orientation", fallback("learning_orientation", "unknown")),
+        "communication_strength": personality.get("communication_strength", fallback("communication_strength", "unknown")),
+        "risk_profile": personality.get("risk_profile", fallback("risk_profile", "unknown")),
+        "personality_confidence": personality.get("confidence", fallback("personality_confidence", 0.0)),
+        "leadership_signals": kundali.get("leadership_signals", []),
+        "red_flags": kundali.get("red_flags", []),
+        "overall_confidence_score": kundali.get("overall_confidence_score", fallback("overall_confidence_score", 0.0)),
+    }
+
+
+def _update_changed_columns(db: Session, record: Any, values: Dict[str, Any]) -> None:
+    """Issue a single UPDATE containing only the columns whose value changed"""
+    changed = {column: value for column, value in values.items() if getattr(record, column) != value}
+    if not changed:
+        return
+    model = type(record)
+    db.execute(update(model).where(model.id == record.id).values(**changed))
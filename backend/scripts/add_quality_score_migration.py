@@ -8,11 +8,32 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.core.database import SessionLocal
+from app.core.database import MaintenanceSession
+from app.models.resume import ResumeVersion, Resume
+from app.resumes.ai_parser import ai_parser
+
+UPDATE_BATCH_SIZE = 1000
+
+
+def _apply_quality_scores(db, scores):
+    """Write a batch of (version_id, score) pairs with one UPDATE ... FROM (VALUES ...)"""
+    values = ", ".join(f"(:id_{i}, :score_{i})" for i in range(len(scores)))
+    params = {}
+    for i, (version_id, score) in enumerate(scores):
+        params[f"id_{i}"] = version_id
+        params[f"score_{i}"] = score
+    db.execute(
+        text(
+            "UPDATE resume_versions AS rv SET quality_score = v.score "
+            f"FROM (VALUES {values}) AS v(id, score) WHERE rv.id = v.id"
+        ),
+        params,
+    )
+
 
 def add_quality_score_column():
     """Add quality_score column to resume_versions table"""
-    db = SessionLocal()
+    db = MaintenanceSession()
     try:
         # Check if column already exists
         result = db.execute(text("""
@@ -35,25 +56,28 @@ def add_quality_score_column():
         
         # Calculate quality scores for existing records
         print("\n📊 Calculating quality scores for existing resumes...")
-        from app.models.resume import ResumeVersion, Resume
-        from app.resumes.ai_parser import ai_parser
+        # Join the raw text in and stream rows instead of one Resume query per version
+        rows = (
+            db.query(ResumeVersion, Resume.raw_text)
+            .join(Resume, Resume.id == ResumeVersion.resume_id)
+            .filter(ResumeVersion.is_current == True, Resume.raw_text.isnot(None), Resume.raw_text != "")
+            .yield_per(500)
+        )
         
-        versions = db.query(ResumeVersion).filter(ResumeVersion.is_current == True).all()
-        updated = 0
+        scores = []
+        for version, raw_text in rows:
+            parsed_data = {
+                "skills": version.skills or [],
+                "experience": version.experience or [],
+                "education": version.education or [],
+                "projects": version.projects or [],
+                "experience_years": version.experience_years,
+            }
+            scores.append((version.id, ai_parser._calculate_quality_score(parsed_data, raw_text)))
         
-        for version in versions:
-            resume = db.query(Resume).filter(Resume.id == version.resume_id).first()
-            if resume and resume.raw_text:
-                parsed_data = {
-                    "skills": version.skills or [],
-                    "experience": version.experience or [],
-                    "education": version.education or [],
-                    "projects": version.projects or [],
-                    "experience_years": version.experience_years,
-                }
-                quality_score = ai_parser._calculate_quality_score(parsed_data, resume.raw_text)
-                version.quality_score = quality_score
-                updated += 1
+        for start in range(0, len(scores), UPDATE_BATCH_SIZE):
+            _apply_quality_scores(db, scores[start:start + UPDATE_BATCH_SIZE])
+        updated = len(scores)
         
         db.commit()
         print(f"✅ Updated quality scores for {updated} resume versions")
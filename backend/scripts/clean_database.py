@@ -6,12 +6,14 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from app.core.database import MaintenanceSession
 from app.models.candidate import Candidate
 from app.models.candidate_kundali import CandidateKundali
 from app.models.resume import Resume, ResumeVersion
 from app.models.job import JobDescription
+from app.models.user import User, Role
 from app.models.matching import MatchResult, AIExplanation
 import structlog
 
@@ -20,43 +22,45 @@ logger = structlog.get_logger()
 
 def clean_database():
     """Clean candidates and resume data, preserve jobs and users"""
-    db: Session = SessionLocal()
+    db: Session = MaintenanceSession()
     try:
         logger.info("starting_database_cleanup")
         
+        # Bulk DELETEs without session synchronization; each returns its rowcount
+        
         # Delete AI Explanations (related to matches)
-        ai_explanations_count = db.query(AIExplanation).count()
-        db.query(AIExplanation).delete()
+        ai_explanations_count = db.query(AIExplanation).delete(synchronize_session=False)
         logger.info("deleted_ai_explanations", count=ai_explanations_count)
         
         # Delete Match Results
-        match_results_count = db.query(MatchResult).count()
-        db.query(MatchResult).delete()
+        match_results_count = db.query(MatchResult).delete(synchronize_session=False)
         logger.info("deleted_match_results", count=match_results_count)
         
         # Delete Resume Versions
-        resume_versions_count = db.query(ResumeVersion).count()
-        db.query(ResumeVersion).delete()
+        resume_versions_count = db.query(ResumeVersion).delete(synchronize_session=False)
         logger.info("deleted_resume_versions", count=resume_versions_count)
         
         # Delete Candidate Kundalis (must be deleted before Candidates due to FK constraint)
-        candidate_kundalis_count = db.query(CandidateKundali).count()
-        db.query(CandidateKundali).delete()
+        candidate_kundalis_count = db.query(CandidateKundali).delete(synchronize_session=False)
         logger.info("deleted_candidate_kundalis", count=candidate_kundalis_count)
         
         # Delete Candidates
-        candidates_count = db.query(Candidate).count()
-        db.query(Candidate).delete()
+        candidates_count = db.query(Candidate).delete(synchronize_session=False)
         logger.info("deleted_candidates", count=candidates_count)
         
         # Delete Resumes
-        resumes_count = db.query(Resume).count()
-        db.query(Resume).delete()
+        resumes_count = db.query(Resume).delete(synchronize_session=False)
         logger.info("deleted_resumes", count=resumes_count)
         
-        # Jobs are PRESERVED - not deleted
-        jobs_count = db.query(JobDescription).count()
-        logger.info("preserved_jobs", count=jobs_count)
+        # Jobs, users and roles are PRESERVED - counted together in one round trip
+        jobs_count, users_count, roles_count = db.execute(
+            select(
+                select(func.count(JobDescription.id)).scalar_subquery(),
+                select(func.count(User.id)).scalar_subquery(),
+                select(func.count(Role.id)).scalar_subquery(),
+            )
+        ).one()
+        logger.info("preserved_records", jobs=jobs_count, users=users_count, roles=roles_count)
         
         db.commit()
         logger.info("database_cleanup_complete")
@@ -69,7 +73,7 @@ def clean_database():
         print(f"   - Deleted {resumes_count} Resumes")
         print(f"\n✅ Preserved:")
         print(f"   - {jobs_count} Jobs")
-        print(f"   - All Users and Roles")
+        print(f"   - {users_count} Users and {roles_count} Roles")
         
     except Exception as e:
         logger.error("database_cleanup_failed", error=str(e))
@@ -1,15 +1,20 @@
 """
 Script to create comprehensive test data for development
 """
+import csv
+import io
+import json
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 import random
-from datetime import datetime, timedelta
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import JSON, insert
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from app.core.database import MaintenanceSession
 from app.models.user import User, Role
 from app.models.job import JobDescription
 from app.models.resume import Resume, ResumeVersion
@@ -22,6 +27,13 @@ import structlog
 logger = structlog.get_logger()
 fake = Faker()
 
+# Filler text is drawn from small pre-generated pools; Faker's text providers are
+# much slower than a random.choice and the seeded data does not need unique prose
+SENTENCE_POOL = [fake.sentence() for _ in range(100)]
+PARAGRAPH_POOL = [fake.paragraph() for _ in range(50)]
+COMPANY_POOL = [fake.company() for _ in range(50)]
+CATCH_PHRASE_POOL = [fake.catch_phrase() for _ in range(50)]
+
 # Sample data pools
 JOB_TITLES = [
     "Senior Backend Engineer", "Full Stack Developer", "Frontend Developer",
@@ -40,14 +52,14 @@ COMPANIES = [
 
 DEPARTMENTS = ["Engineering", "Product", "Data Science", "Design", "DevOps", "Security", "Research"]
 
-SKILLS_POOL = [
+SKILLS_POOL = (
     "python", "javascript", "typescript", "java", "go", "rust", "c++", "c#",
     "react", "vue", "angular", "node.js", "django", "flask", "fastapi", "spring",
     "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "aws", "azure", "gcp",
     "docker", "kubernetes", "terraform", "jenkins", "git", "graphql", "rest api",
     "machine learning", "deep learning", "tensorflow", "pytorch", "pandas", "numpy",
     "agile", "scrum", "ci/cd", "microservices", "system design", "algorithms", "data structures"
-]
+)
 
 SENIORITY_LEVELS = ["junior", "mid", "senior", "lead", "principal"]
 EMPLOYMENT_TYPES = ["full-time", "part-time", "contract", "internship"]
@@ -58,84 +70,124 @@ LOCATIONS = [
 
 STATUSES = ["new", "screening", "interview", "offer", "rejected", "hired"]
 
+# Row counts; raise them through the environment to seed data for load testing
+N_JOBS = int(os.getenv("N_JOBS", "20"))
+N_CANDIDATES = int(os.getenv("N_CANDIDATES", "30"))
+# Candidate count from which row generation is spread over a process pool
+PARALLEL_BUILD_THRESHOLD = 500
+
 EDUCATION_DEGREES = ["Bachelor's", "Master's", "PhD", "Associate's", "Diploma"]
 EDUCATION_FIELDS = ["Computer Science", "Software Engineering", "Information Technology", "Data Science", "Mathematics", "Electrical Engineering"]
 
 
+def _bullets(items) -> str:
+    """Render items as a "- item" list, one per line"""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _copy_rows(db: Session, model, rows: list):
+    """
+    Bulk load rows into a table with COPY FROM STDIN.
+    
+    COPY cannot return generated ids, so this is only used for leaf tables whose
+    ids nothing else needs. Every row must have the same keys; None is loaded as
+    NULL, and so is an empty string (unquoted empty CSV field).
+    """
+    if not rows:
+        return
+    if db.bind.dialect.name != "postgresql":
+        db.execute(insert(model), rows)
+        return
+    
+    table = model.__table__
+    columns = list(rows[0])
+    json_columns = {name for name in columns if isinstance(table.c[name].type, JSON)}  # includes JSONB
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([json.dumps(row[name]) if name in json_columns else row[name] for name in columns])
+    buffer.seek(0)
+    
+    # Raw psycopg2 cursor on the session's connection, so the COPY joins the same transaction
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    finally:
+        cursor.close()
+
+
 def create_test_users(db: Session):
     """Create test users with different roles"""
-    admin = db.query(User).filter(User.email == "admin@hirelens.ai").first()
-    if not admin:
+    # Only the admin's id is used (as created_by), so fetch just that column
+    admin_id = db.query(User.id).filter(User.email == "admin@hirelens.ai").scalar()
+    if admin_id is None:
         logger.warning("admin_user_not_found")
         return None
     
     # Get roles
-    admin_role = db.query(Role).filter(Role.name == "admin").first()
-    recruiter_role = db.query(Role).filter(Role.name == "recruiter").first()
-    hiring_manager_role = db.query(Role).filter(Role.name == "hiring_manager").first()
+    roles = {r.name: r for r in db.query(Role).filter(Role.name.in_(["recruiter", "hiring_manager"]))}
+    recruiter_role = roles.get("recruiter")
+    hiring_manager_role = roles.get("hiring_manager")
     
-    # Create additional test users
-    test_users = []
-    for i in range(5):
-        email = f"recruiter{i+1}@test.com"
-        existing = db.query(User).filter(User.email == email).first()
-        if not existing:
-            user = User(
-                email=email,
-                hashed_password=get_password_hash("password123"),
-                full_name=fake.name(),
-                is_active=True,
-                is_verified=True,
-            )
-            user.roles = [recruiter_role] if recruiter_role else []
-            db.add(user)
-            test_users.append(user)
-            logger.info("test_user_created", email=email)
+    # Create additional test users (one existence query for all seeded emails)
+    seed_users = [(f"recruiter{i+1}@test.com", recruiter_role) for i in range(5)]
+    seed_users += [(f"manager{i+1}@test.com", hiring_manager_role) for i in range(3)]
+    existing_emails = {
+        email for (email,) in db.query(User.email).filter(User.email.in_([e for e, _ in seed_users]))
+    }
     
-    for i in range(3):
-        email = f"manager{i+1}@test.com"
-        existing = db.query(User).filter(User.email == email).first()
-        if not existing:
+    # All test users share one password; hash it once (bcrypt is deliberately slow)
+    shared_hash = get_password_hash("password123")
+    test_users = []
+    for email, role in seed_users:
+        if email not in existing_emails:
             user = User(
                 email=email,
-                hashed_password=get_password_hash("password123"),
+                hashed_password=shared_hash,
                 full_name=fake.name(),
                 is_active=True,
                 is_verified=True,
             )
-            user.roles = [hiring_manager_role] if hiring_manager_role else []
+            user.roles = [role] if role else []
             db.add(user)
             test_users.append(user)
-            logger.info("test_user_created", email=email)
-    
-    db.commit()
-    return admin
+    logger.info("test_users_created", count=len(test_users))
+    return admin_id
 
 
-def create_test_jobs(db: Session, admin: User):
+def create_test_jobs(db: Session, admin_id: int):
     """Create multiple test job descriptions"""
-    jobs = []
+    # Existing (title, company) pairs in one query; new pairs are added as they are generated
+    seen = set(db.query(JobDescription.title, JobDescription.company).all())
+    job_rows = []
     
-    for i in range(20):  # Create 20 jobs
+    for i in range(N_JOBS):
         title = random.choice(JOB_TITLES)
         company = random.choice(COMPANIES)
         department = random.choice(DEPARTMENTS)
         
         # Check if job already exists
-        existing = db.query(JobDescription).filter(
-            JobDescription.title == title,
-            JobDescription.company == company
-        ).first()
-        if existing:
+        if (title, company) in seen:
             continue
+        seen.add((title, company))
+        
+        # Drawn once so the stored columns match what raw_text describes
+        experience_years = random.randint(2, 10)
+        seniority_level = random.choice(SENIORITY_LEVELS)
+        location = random.choice(LOCATIONS)
+        employment_type = random.choice(EMPLOYMENT_TYPES)
         
         # Generate skills
         num_required = random.randint(4, 8)
         num_nice_to_have = random.randint(2, 5)
         required_skills = random.sample(SKILLS_POOL, min(num_required, len(SKILLS_POOL)))
+        required_set = set(required_skills)
+        remaining_skills = [s for s in SKILLS_POOL if s not in required_set]
         nice_to_have_skills = random.sample(
-            [s for s in SKILLS_POOL if s not in required_skills],
-            min(num_nice_to_have, len(SKILLS_POOL) - num_required)
+            remaining_skills, min(num_nice_to_have, len(remaining_skills))
         )
         
         # Generate job description text
@@ -145,192 +197,213 @@ def create_test_jobs(db: Session, admin: User):
         We are looking for a {title} to join our {department} team.
         
         Required Skills:
-        {chr(10).join(['- ' + skill for skill in required_skills])}
+        {_bullets(required_skills)}
         
         Nice to Have:
-        {chr(10).join(['- ' + skill for skill in nice_to_have_skills])}
+        {_bullets(nice_to_have_skills)}
         
-        Experience: {random.randint(2, 10)}+ years of experience required.
-        Location: {random.choice(LOCATIONS)}
-        Employment Type: {random.choice(EMPLOYMENT_TYPES)}
+        Experience: {experience_years}+ years of experience required.
+        Location: {location}
+        Employment Type: {employment_type}
         
         About the Role:
         {fake.paragraph(nb_sentences=5)}
         
         Responsibilities:
-        {chr(10).join(['- ' + fake.sentence() for _ in range(5)])}
+        {_bullets(random.choices(SENTENCE_POOL, k=5))}
         
         Qualifications:
-        {chr(10).join(['- ' + fake.sentence() for _ in range(4)])}
+        {_bullets(random.choices(SENTENCE_POOL, k=4))}
         """
         
-        job = JobDescription(
+        job_rows.append(dict(
             title=title,
             company=company,
             department=department,
             raw_text=raw_text,
             required_skills=required_skills,
             nice_to_have_skills=nice_to_have_skills,
-            experience_years_required=random.randint(2, 10),
-            seniority_level=random.choice(SENIORITY_LEVELS),
-            location=random.choice(LOCATIONS),
+            experience_years_required=experience_years,
+            seniority_level=seniority_level,
+            location=location,
             remote_allowed=random.choice([True, False]),
-            employment_type=random.choice(EMPLOYMENT_TYPES),
-            created_by=admin.id,
+            employment_type=employment_type,
+            created_by=admin_id,
             is_active=random.choice([True, True, True, False]),  # Mostly active
             is_archived=random.choice([False, False, False, True]),
-        )
-        db.add(job)
-        jobs.append(job)
-        logger.info("test_job_created", job_id=job.id, title=title, company=company)
+        ))
     
-    db.commit()
+    # One multi-row INSERT ... RETURNING; the returned jobs are used for match results
+    jobs = db.scalars(insert(JobDescription).returning(JobDescription), job_rows).all() if job_rows else []
     return jobs
 
 
-def create_test_resumes_and_candidates(db: Session, admin: User):
-    """Create test resumes and candidates"""
-    resumes = []
-    candidates = []
+def build_candidate_rows(i: int, seed: int, admin_id: int):
+    """Build the resume, resume version and candidate rows for one test candidate (no DB access)"""
+    # Reseed per candidate so rows built in pool workers (which inherit the parent's
+    # RNG state on fork) are not duplicates of each other
+    random.seed(seed + i)
+    fake.seed_instance(seed + i)
     
-    for i in range(30):  # Create 30 candidates
-        # Create resume
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        email = fake.email()
-        phone = fake.phone_number()
-        
-        # Generate resume text
-        years_exp = random.randint(1, 15)
-        skills = random.sample(SKILLS_POOL, random.randint(5, 15))
-        
-        resume_text = f"""
-        {first_name} {last_name}
-        {email} | {phone}
-        {fake.address()}
-        LinkedIn: linkedin.com/in/{fake.user_name()}
-        
-        PROFESSIONAL SUMMARY
-        {fake.paragraph(nb_sentences=3)}
-        
-        EXPERIENCE ({years_exp} years)
-        """
-        
-        # Add work experience
-        for j in range(random.randint(2, 5)):
-            company = fake.company()
-            role = random.choice(JOB_TITLES)
-            start_date = fake.date_between(start_date='-10y', end_date='-1y')
-            end_date = fake.date_between(start_date=start_date, end_date='today')
-            resume_text += f"""
-        
-        {role} at {company}
-        {start_date.strftime('%B %Y')} - {end_date.strftime('%B %Y')}
-        {chr(10).join(['- ' + fake.sentence() for _ in range(random.randint(3, 6))])}
-        """
-        
-        resume_text += f"""
-        
-        EDUCATION
-        {random.choice(EDUCATION_DEGREES)} in {random.choice(EDUCATION_FIELDS)}
-        {fake.company()} University
-        {fake.year()}
-        
-        SKILLS
-        {', '.join(skills)}
-        
-        CERTIFICATIONS
-        {chr(10).join(['- ' + fake.sentence() for _ in range(random.randint(1, 3))])}
-        
-        PROJECTS
-        {chr(10).join(['- ' + fake.sentence() for _ in range(random.randint(2, 4))])}
-        """
-        
-        # Create resume record
-        resume = Resume(
-            file_name=f"resume_{i+1}.pdf",
-            file_path=f"/uploads/resume_{i+1}.pdf",
-            file_size=random.randint(50000, 500000),
-            file_type="pdf",
-            raw_text=resume_text,
-            processing_status="completed",
-        )
-        db.add(resume)
-        db.flush()  # Get the ID
-        
-        # Create resume version with parsed data
-        resume_version = ResumeVersion(
-            resume_id=resume.id,
-            version_number=1,
-            parsed_data={
-                "name": f"{first_name} {last_name}",
-                "email": email,
-                "phone": phone,
-                "summary": fake.paragraph(),
-            },
-            skills=skills,
-            experience_years=years_exp,
-            education=[
-                {
-                    "degree": random.choice(EDUCATION_DEGREES),
-                    "field": random.choice(EDUCATION_FIELDS),
-                    "institution": fake.company() + " University",
-                    "year": fake.year(),
-                }
-            ],
-            experience=[
-                {
-                    "title": random.choice(JOB_TITLES),
-                    "company": fake.company(),
-                    "duration": f"{random.randint(1, 5)} years",
-                    "description": fake.paragraph(),
-                }
-                for _ in range(random.randint(2, 5))
-            ],
-            projects=[
-                {
-                    "name": fake.catch_phrase(),
-                    "description": fake.sentence(),
-                    "technologies": random.sample(SKILLS_POOL, random.randint(2, 5)),
-                }
-                for _ in range(random.randint(2, 4))
-            ],
-            certifications=[
-                {"name": fake.catch_phrase(), "issuer": fake.company()}
-                for _ in range(random.randint(1, 3))
-            ],
-            languages=[{"name": "English", "proficiency": "Native"}],
-            is_current=True,
-            parser_version="1.0",
-        )
-        db.add(resume_version)
-        
-        # Create candidate
-        candidate = Candidate(
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            phone=phone,
-            linkedin_url=f"linkedin.com/in/{fake.user_name()}",
-            portfolio_url=f"https://{fake.domain_name()}" if random.choice([True, False]) else None,
-            resume_id=resume.id,
-            status=random.choice(STATUSES),
-            notes=fake.paragraph() if random.choice([True, False]) else None,
-            created_by=admin.id,
-        )
-        db.add(candidate)
-        
-        resumes.append(resume)
-        candidates.append(candidate)
-        logger.info("test_candidate_created", candidate_id=candidate.id, email=email)
+    # Create resume
+    first_name = fake.first_name()
+    last_name = fake.last_name()
+    email = fake.email()
+    phone = fake.phone_number()
+    
+    # Generate resume text
+    years_exp = random.randint(1, 15)
+    skills = random.sample(SKILLS_POOL, random.randint(5, 15))
+    
+    parts = [f"""
+    {first_name} {last_name}
+    {email} | {phone}
+    {fake.address()}
+    LinkedIn: linkedin.com/in/{fake.user_name()}
+    
+    PROFESSIONAL SUMMARY
+    {fake.paragraph(nb_sentences=3)}
+    
+    EXPERIENCE ({years_exp} years)
+    """]
+    
+    # Add work experience
+    for j in range(random.randint(2, 5)):
+        company = random.choice(COMPANY_POOL)
+        role = random.choice(JOB_TITLES)
+        start_date = fake.date_between(start_date='-10y', end_date='-1y')
+        end_date = fake.date_between(start_date=start_date, end_date='today')
+        parts.append(f"""
     
-    db.commit()
+    {role} at {company}
+    {start_date.strftime('%B %Y')} - {end_date.strftime('%B %Y')}
+    {_bullets(random.choices(SENTENCE_POOL, k=random.randint(3, 6)))}
+    """)
+    
+    parts.append(f"""
+    
+    EDUCATION
+    {random.choice(EDUCATION_DEGREES)} in {random.choice(EDUCATION_FIELDS)}
+    {random.choice(COMPANY_POOL)} University
+    {fake.year()}
+    
+    SKILLS
+    {', '.join(skills)}
+    
+    CERTIFICATIONS
+    {_bullets(random.choices(SENTENCE_POOL, k=random.randint(1, 3)))}
+    
+    PROJECTS
+    {_bullets(random.choices(SENTENCE_POOL, k=random.randint(2, 4)))}
+    """)
+    resume_text = "".join(parts)
+    
+    # Create resume record
+    resume_row = dict(
+        file_name=f"resume_{i+1}.pdf",
+        file_path=f"/uploads/resume_{i+1}.pdf",
+        file_size=random.randint(50000, 500000),
+        file_type="pdf",
+        raw_text=resume_text,
+        processing_status="completed",
+    )
+    
+    # Create resume version with parsed data (resume_id is filled in after the bulk insert)
+    version_row = dict(
+        version_number=1,
+        parsed_data={
+            "name": f"{first_name} {last_name}",
+            "email": email,
+            "phone": phone,
+            "summary": random.choice(PARAGRAPH_POOL),
+        },
+        skills=skills,
+        experience_years=years_exp,
+        education=[
+            {
+                "degree": random.choice(EDUCATION_DEGREES),
+                "field": random.choice(EDUCATION_FIELDS),
+                "institution": random.choice(COMPANY_POOL) + " University",
+                "year": fake.year(),
+            }
+        ],
+        experience=[
+            {
+                "title": random.choice(JOB_TITLES),
+                "company": random.choice(COMPANY_POOL),
+                "duration": f"{random.randint(1, 5)} years",
+                "description": random.choice(PARAGRAPH_POOL),
+            }
+            for _ in range(random.randint(2, 5))
+        ],
+        projects=[
+            {
+                "name": random.choice(CATCH_PHRASE_POOL),
+                "description": random.choice(SENTENCE_POOL),
+                "technologies": random.sample(SKILLS_POOL, random.randint(2, 5)),
+            }
+            for _ in range(random.randint(2, 4))
+        ],
+        certifications=[
+            {"name": random.choice(CATCH_PHRASE_POOL), "issuer": random.choice(COMPANY_POOL)}
+            for _ in range(random.randint(1, 3))
+        ],
+        languages=[{"name": "English", "proficiency": "Native"}],
+        is_current=True,
+        parser_version="1.0",
+    )
+    
+    # Create candidate
+    candidate_row = dict(
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        phone=phone,
+        linkedin_url=f"linkedin.com/in/{fake.user_name()}",
+        portfolio_url=f"https://{fake.domain_name()}" if random.choice([True, False]) else None,
+        status=random.choice(STATUSES),
+        notes=random.choice(PARAGRAPH_POOL) if random.choice([True, False]) else None,
+        created_by=admin_id,
+    )
+    return resume_row, version_row, candidate_row
+
+
+def create_test_resumes_and_candidates(db: Session, admin_id: int):
+    """Create test resumes and candidates"""
+    # Row generation is pure CPU work (Faker, random, string building), so large
+    # seeds fan it out over a process pool; the inserts below stay in this process
+    seed = random.getrandbits(32)
+    args = [(i, seed, admin_id) for i in range(N_CANDIDATES)]
+    if N_CANDIDATES >= PARALLEL_BUILD_THRESHOLD:
+        with multiprocessing.Pool() as pool:
+            payloads = pool.starmap(build_candidate_rows, args)
+    else:
+        payloads = [build_candidate_rows(*a) for a in args]
+    resume_rows = [resume_row for resume_row, _, _ in payloads]
+    version_rows = [version_row for _, version_row, _ in payloads]
+    candidate_rows = [candidate_row for _, _, candidate_row in payloads]
+    
+    # Parents first, then children: INSERT ... RETURNING for the tables whose ids are
+    # needed, COPY for the resume versions
+    resumes = db.scalars(
+        insert(Resume).returning(Resume, sort_by_parameter_order=True), resume_rows
+    ).all()
+    for resume, version_row, candidate_row in zip(resumes, version_rows, candidate_rows):
+        version_row["resume_id"] = resume.id
+        candidate_row["resume_id"] = resume.id
+    _copy_rows(db, ResumeVersion, version_rows)
+    candidates = db.scalars(
+        insert(Candidate).returning(Candidate, sort_by_parameter_order=True), candidate_rows
+    ).all()
     return resumes, candidates
 
 
 def create_match_results(db: Session, jobs: list, candidates: list):
     """Create match results between candidates and jobs"""
-    match_results = []
+    # Existing (candidate, job) pairs in one query instead of one lookup per pair
+    seen = set(db.query(MatchResult.candidate_id, MatchResult.job_description_id).all())
+    match_rows = []
+    explanation_rows = []
     
     # Match each candidate with 2-5 random jobs
     for candidate in candidates:
@@ -339,12 +412,9 @@ def create_match_results(db: Session, jobs: list, candidates: list):
         
         for job in selected_jobs:
             # Check if match already exists
-            existing = db.query(MatchResult).filter(
-                MatchResult.candidate_id == candidate.id,
-                MatchResult.job_description_id == job.id
-            ).first()
-            if existing:
+            if (candidate.id, job.id) in seen:
                 continue
+            seen.add((candidate.id, job.id))
             
             # Generate scores
             overall_score = round(random.uniform(45, 95), 2)
@@ -356,7 +426,7 @@ def create_match_results(db: Session, jobs: list, candidates: list):
             confidence_level = "high" if overall_score > 80 else "medium" if overall_score > 60 else "low"
             percentile_rank = round(random.uniform(10, 95), 2)
             
-            match_result = MatchResult(
+            match_rows.append(dict(
                 candidate_id=candidate.id,
                 job_description_id=job.id,
                 overall_score=overall_score,
@@ -367,9 +437,7 @@ def create_match_results(db: Session, jobs: list, candidates: list):
                 domain_familiarity_score=domain_familiarity_score,
                 percentile_rank=percentile_rank,
                 is_active=True,
-            )
-            db.add(match_result)
-            db.flush()  # Get the ID
+            ))
             
             # Create AI explanation
             strengths = [
@@ -386,8 +454,8 @@ def create_match_results(db: Session, jobs: list, candidates: list):
                 f"Evaluate {random.choice(['cultural fit', 'communication skills', 'problem-solving approach'])}",
             ]
             
-            ai_explanation = AIExplanation(
-                match_result_id=match_result.id,
+            # match_result_id is filled in after the match results are inserted
+            explanation_rows.append(dict(
                 summary=fake.paragraph(nb_sentences=3),
                 strengths=strengths,
                 weaknesses=weaknesses,
@@ -407,39 +475,38 @@ def create_match_results(db: Session, jobs: list, candidates: list):
                 confidence_score=round(random.uniform(0.6, 0.95), 2),
                 reasoning_quality=random.choice(["high", "medium", "low"]),
                 model_used="huggingface/mistral-7b",
-            )
-            db.add(ai_explanation)
-            
-            match_results.append(match_result)
-            logger.info(
-                "test_match_created",
-                match_id=match_result.id,
-                candidate_id=candidate.id,
-                job_id=job.id,
-                score=overall_score
-            )
+            ))
+    
+    if not match_rows:
+        return []
     
-    db.commit()
+    # Match results need their ids back (INSERT ... RETURNING); explanations are COPYed
+    match_results = db.scalars(
+        insert(MatchResult).returning(MatchResult, sort_by_parameter_order=True), match_rows
+    ).all()
+    for match_result, explanation_row in zip(match_results, explanation_rows):
+        explanation_row["match_result_id"] = match_result.id
+    _copy_rows(db, AIExplanation, explanation_rows)
     return match_results
 
 
 def main():
     """Main function to create all test data"""
     logger.info("starting_test_data_creation")
-    db: Session = SessionLocal()
+    db: Session = MaintenanceSession()
     try:
         # Create users
-        admin = create_test_users(db)
-        if not admin:
+        admin_id = create_test_users(db)
+        if admin_id is None:
             logger.error("admin_user_not_found_cannot_create_data")
             return
         
         # Create jobs
-        jobs = create_test_jobs(db, admin)
+        jobs = create_test_jobs(db, admin_id)
         logger.info("jobs_created", count=len(jobs))
         
         # Create resumes and candidates
-        resumes, candidates = create_test_resumes_and_candidates(db, admin)
+        resumes, candidates = create_test_resumes_and_candidates(db, admin_id)
         logger.info("candidates_created", count=len(candidates))
         
         # Create match results
@@ -447,6 +514,8 @@ def main():
             match_results = create_match_results(db, jobs, candidates)
             logger.info("match_results_created", count=len(match_results))
         
+        # Single commit: all seeded data lands in one transaction (one WAL flush)
+        db.commit()
         logger.info("test_data_creation_complete")
     except Exception as e:
         logger.error("test_data_creation_failed", error=str(e))
@@ -1,14 +1,17 @@
 """
 Initialize database with default roles and admin user
 """
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal, init_db
+from app.core.database import MaintenanceSession, init_db
 from app.models.user import User, Role
 from app.auth.service import get_password_hash
 import structlog
@@ -22,25 +25,26 @@ def create_default_roles(db: Session):
         {
             "name": "admin",
             "description": "System administrator with full access",
-            "permissions": '["*"]',
+            "permissions": ["*"],
         },
         {
             "name": "recruiter",
             "description": "Recruiter with access to manage jobs and candidates",
-            "permissions": '["jobs:read", "jobs:write", "candidates:read", "candidates:write", "resumes:read", "resumes:write", "matching:read"]',
+            "permissions": ["jobs:read", "jobs:write", "candidates:read", "candidates:write", "resumes:read", "resumes:write", "matching:read"],
         },
         {
             "name": "hiring_manager",
             "description": "Hiring manager with read-only access to insights",
-            "permissions": '["jobs:read", "candidates:read", "matching:read"]',
+            "permissions": ["jobs:read", "candidates:read", "matching:read"],
         },
     ]
     
+    # One idempotent INSERT for all roles; RETURNING reports only the rows actually inserted
+    created = set(db.scalars(
+        insert(Role).values(roles).on_conflict_do_nothing(index_elements=["name"]).returning(Role.name)
+    ))
     for role_data in roles:
-        existing = db.query(Role).filter(Role.name == role_data["name"]).first()
-        if not existing:
-            role = Role(**role_data)
-            db.add(role)
+        if role_data["name"] in created:
             logger.info("role_created", role=role_data["name"])
         else:
             logger.info("role_exists", role=role_data["name"])
@@ -53,19 +57,28 @@ def create_admin_user(db: Session):
     admin_email = "admin@hirelens.ai"
     admin_password = "admin123"  # Change in production!
     
-    existing = db.query(User).filter(User.email == admin_email).first()
-    if existing:
-        logger.info("admin_user_exists", email=admin_email)
+    # Admin role and any existing admin user in one query
+    row = db.execute(
+        select(Role, User.id)
+        .outerjoin(User, User.email == admin_email)
+        .where(Role.name == "admin")
+    ).first()
+    if not row:
+        logger.error("admin_role_not_found")
         return
     
-    admin_role = db.query(Role).filter(Role.name == "admin").first()
-    if not admin_role:
-        logger.error("admin_role_not_found")
+    admin_role, existing_user_id = row
+    if existing_user_id is not None:
+        logger.info("admin_user_exists", email=admin_email)
         return
     
+    # Throwaway environments (CI, test containers) can export a precomputed hash to skip bcrypt:
+    # python -c "from app.auth.service import get_password_hash; print(get_password_hash('admin123'))"
+    hashed_password = os.getenv("ADMIN_PASSWORD_HASH") or get_password_hash(admin_password)
+    
     admin_user = User(
         email=admin_email,
-        hashed_password=get_password_hash(admin_password),
+        hashed_password=hashed_password,
         full_name="System Administrator",
         is_active=True,
         is_verified=True,
@@ -86,7 +99,7 @@ def main():
     init_db()
     
     # Create session
-    db: Session = SessionLocal()
+    db: Session = MaintenanceSession()
     try:
         # Create default roles
         create_default_roles(db)
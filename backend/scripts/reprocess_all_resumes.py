@@ -0,0 +1,74 @@
+"""
+Script to re-run processing for all resumes
+Marks resumes pending one batch at a time (one UPDATE and commit per batch),
+then queues their processing chains over a single broker connection
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, update
+from app.core.celery_app import celery_app
+from app.core.database import MaintenanceSession
+from app.models.resume import Resume
+from app.tasks.resume_tasks import dispatch_resume_processing
+import structlog
+
+logger = structlog.get_logger()
+
+
+def reprocess_all_resumes(batch_size: int = 500, force_reprocess: bool = True):
+    """Reset all resumes to pending and queue them for processing"""
+    db = MaintenanceSession()
+    
+    try:
+        resume_ids = db.scalars(select(Resume.id).order_by(Resume.id)).all()
+        
+        print(f"Found {len(resume_ids)} resumes to reprocess")
+        
+        # Reuse one producer (one broker connection) for every chain; batched
+        # persistence commits the parsed versions in groups
+        with celery_app.producer_or_acquire() as producer:
+            for start in range(0, len(resume_ids), batch_size):
+                batch = resume_ids[start:start + batch_size]
+                # One UPDATE and one commit per batch, committed before its chains are queued
+                db.execute(
+                    update(Resume)
+                    .where(Resume.id.in_(batch))
+                    .values(processing_status="pending", processing_error=None)
+                )
+                db.commit()
+                for resume_id in batch:
+                    dispatch_resume_processing(
+                        resume_id, force_reprocess=force_reprocess, batched=True, producer=producer
+                    )
+        
+        logger.info("resumes_queued_for_reprocessing", count=len(resume_ids))
+        print(f"\n✅ Queued {len(resume_ids)} resumes for reprocessing")
+        
+    except Exception as e:
+        db.rollback()
+        logger.error("reprocess_all_resumes_failed", error=str(e))
+        print(f"❌ Error: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Re-run processing for all resumes")
+    arg_parser.add_argument("--yes", action="store_true", help="skip the confirmation prompt (cron/CI runs)")
+    arg_parser.add_argument("--batch-size", type=int, default=500, help="resumes reset and queued per batch")
+    args = arg_parser.parse_args()
+    
+    if not args.yes:
+        answer = input("Reset ALL resumes to pending and queue them for reprocessing? [y/N] ")
+        if answer.strip().lower() != "y":
+            print("Aborted.")
+            sys.exit(0)
+    
+    print("Starting resume reprocessing...")
+    reprocess_all_resumes(batch_size=args.batch_size)
+    print("Done!")
@@ -6,51 +6,73 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from app.core.database import MaintenanceSession
 from app.models.resume import Resume, ResumeVersion
 from app.resumes.ai_parser import ai_parser
 
 def update_quality_scores():
     """Update quality scores for all existing resume versions"""
-    db: Session = SessionLocal()
+    db: Session = MaintenanceSession()
     try:
-        versions = db.query(ResumeVersion).filter(ResumeVersion.is_current == True).all()
-        
-        if not versions:
-            print("No resume versions found.")
-            return
+        # Only the columns the score needs (no parsed_data blob), joined to the
+        # resume text and streamed from a server-side cursor in batches
+        stmt = (
+            select(
+                ResumeVersion.id,
+                ResumeVersion.resume_id,
+                ResumeVersion.skills,
+                ResumeVersion.experience,
+                ResumeVersion.education,
+                ResumeVersion.projects,
+                ResumeVersion.experience_years,
+                Resume.raw_text,
+            )
+            .join(Resume, Resume.id == ResumeVersion.resume_id)
+            .where(ResumeVersion.is_current == True)
+            .execution_options(yield_per=500)
+        )
         
         print(f"\n{'='*80}")
         print(f"UPDATING QUALITY SCORES")
         print(f"{'='*80}\n")
-        print(f"Found {len(versions)} resume version(s) to update:\n")
         
-        updated = 0
-        for version in versions:
-            resume = db.query(Resume).filter(Resume.id == version.resume_id).first()
-            if not resume or not resume.raw_text:
-                print(f"⚠️  Skipping Resume ID {version.resume_id} - No raw text available")
-                continue
-            
-            # Calculate quality score
-            parsed_data = {
-                "skills": version.skills or [],
-                "experience": version.experience or [],
-                "education": version.education or [],
-                "projects": version.projects or [],
-                "experience_years": version.experience_years,
-            }
-            
-            quality_score = ai_parser._calculate_quality_score(parsed_data, resume.raw_text)
-            version.quality_score = quality_score
-            
-            print(f"✅ Resume ID {version.resume_id}: Quality Score = {quality_score}%")
-            updated += 1
+        # Per-version report lines are buffered and written once, not one write per row
+        report = []
+        payload = []
+        for partition in db.execute(stmt).partitions():
+            for version in partition:
+                if not version.raw_text:
+                    report.append(f"⚠️  Skipping Resume ID {version.resume_id} - No raw text available")
+                    continue
+                
+                # Calculate quality score
+                parsed_data = {
+                    "skills": version.skills or [],
+                    "experience": version.experience or [],
+                    "education": version.education or [],
+                    "projects": version.projects or [],
+                    "experience_years": version.experience_years,
+                }
+                
+                quality_score = ai_parser._calculate_quality_score(parsed_data, version.raw_text)
+                payload.append({"id": version.id, "quality_score": quality_score})
+                
+                report.append(f"✅ Resume ID {version.resume_id}: Quality Score = {quality_score}%")
+        
+        if not report:
+            print("No resume versions found.")
+            return
         
+        # One executemany UPDATE by primary key instead of an ORM flush per version
+        if payload:
+            db.execute(update(ResumeVersion), payload)
         db.commit()
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
         print(f"\n{'='*80}")
-        print(f"✅ Successfully updated quality scores for {updated} resume version(s)")
+        print(f"✅ Successfully updated quality scores for {len(payload)} resume version(s)")
         print(f"{'='*80}\n")
         
     except Exception as e:
@@ -2,97 +2,138 @@
 Script to update all existing seniority levels from 'unknown' to proper levels
 Uses elite seniority analyzer to re-analyze all candidates
 """
-from app.core.database import SessionLocal
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from sqlalchemy import update
+from sqlalchemy.orm import joinedload, load_only
+from app.core.database import MaintenanceSession
+from app.models.candidate import Candidate
 from app.models.candidate_kundali import CandidateKundali
 from app.models.resume import Resume
 from app.resumes.seniority_analyzer import elite_seniority_analyzer
+import sys
 import structlog
 
 logger = structlog.get_logger()
 
-def _flatten_skills(skills_dict):
-    """Flatten skills dictionary to list"""
-    if isinstance(skills_dict, dict):
-        flattened = []
-        for category, skill_list in skills_dict.items():
-            if isinstance(skill_list, list):
-                flattened.extend(skill_list)
-            elif skill_list:
-                flattened.append(skill_list)
-        return flattened
-    elif isinstance(skills_dict, list):
-        return skills_dict
-    return []
+ANALYZER_WORKERS = 4  # Concurrent seniority analyses (Ollama requests in flight)
+
+def _flatten_skills(skills):
+    """Flatten skills (dict of categories or tuple of per-category lists) to list"""
+    if isinstance(skills, list):
+        return skills
+    if isinstance(skills, dict):
+        skills = skills.values()
+    elif not isinstance(skills, tuple):
+        return []
+    return list(chain.from_iterable(v if isinstance(v, list) else [v] for v in skills if v))
+
+def _analyze_seniority(candidate_id, resume_data, raw_text):
+    """Run the seniority analyzer for one candidate; None if it raised"""
+    try:
+        return elite_seniority_analyzer.analyze_seniority(resume_data=resume_data, raw_text=raw_text)
+    except Exception as e:
+        logger.error("failed_to_update_seniority", 
+                   candidate_id=candidate_id, 
+                   error=str(e))
+        return None
 
 def update_seniority_levels():
     """Update all seniority levels that are 'unknown'"""
-    db = SessionLocal()
+    db = MaintenanceSession()
     
     try:
-        # Get all kundalis with unknown seniority
-        kundalis = db.query(CandidateKundali).filter(
-            CandidateKundali.seniority_level == "unknown"
-        ).all()
+        # Get all kundalis with unknown seniority, with candidate and resume in the same query.
+        # Only the columns the analysis reads are loaded; the rest of the Kundali blobs stay in Postgres.
+        kundalis = (
+            db.query(CandidateKundali)
+            .options(
+                load_only(
+                    CandidateKundali.id,
+                    CandidateKundali.candidate_id,
+                    CandidateKundali.name,
+                    CandidateKundali.total_experience_years,
+                    CandidateKundali.experience_data,
+                    CandidateKundali.projects_data,
+                    CandidateKundali.education_data,
+                    CandidateKundali.skills_frontend,
+                    CandidateKundali.skills_backend,
+                    CandidateKundali.skills_data,
+                    CandidateKundali.skills_devops,
+                    CandidateKundali.skills_ai_ml,
+                    CandidateKundali.skills_tools,
+                    CandidateKundali.skills_soft,
+                ),
+                joinedload(CandidateKundali.candidate)
+                .load_only(Candidate.id, Candidate.resume_id)
+                .joinedload(Candidate.resume)
+                .load_only(Resume.id, Resume.raw_text),
+            )
+            .filter(CandidateKundali.seniority_level == "unknown")
+            .all()
+        )
         
         print(f"Found {len(kundalis)} candidates with 'unknown' seniority level")
         
-        updated_count = 0
+        pending = []
         for kundali in kundalis:
-            try:
-                # Get resume for raw text
-                candidate = kundali.candidate
-                if not candidate or not candidate.resume_id:
-                    continue
-                
-                resume = db.query(Resume).filter(Resume.id == candidate.resume_id).first()
-                raw_text = resume.raw_text if resume else ""
-                
-                # Prepare resume data
-                resume_data = {
-                    "experience_years": kundali.total_experience_years or 0,
-                    "experience": kundali.experience_data or [],
-                    "projects": kundali.projects_data or [],
-                    "education": kundali.education_data or [],
-                    "skills": _flatten_skills({
-                        "frontend": kundali.skills_frontend or [],
-                        "backend": kundali.skills_backend or [],
-                        "data": kundali.skills_data or [],
-                        "devops": kundali.skills_devops or [],
-                        "ai_ml": kundali.skills_ai_ml or [],
-                        "tools": kundali.skills_tools or [],
-                        "soft_skills": kundali.skills_soft or [],
-                    }),
-                }
-                
-                # Analyze with elite seniority analyzer
-                seniority_analysis = elite_seniority_analyzer.analyze_seniority(
-                    resume_data=resume_data,
-                    raw_text=raw_text or ""
-                )
-                
-                # Update kundali
-                new_level = seniority_analysis.get("seniority_level", "mid")
-                if new_level == "unknown":
-                    new_level = "mid"  # Never allow unknown
-                
-                kundali.seniority_level = new_level
-                kundali.seniority_confidence = seniority_analysis.get("confidence", 0.7)
-                kundali.seniority_evidence = seniority_analysis.get("evidence", [])
-                
-                updated_count += 1
-                print(f"Updated candidate {kundali.candidate_id}: {kundali.name} -> {new_level}")
-                
-            except Exception as e:
-                logger.error("failed_to_update_seniority", 
-                           candidate_id=kundali.candidate_id, 
-                           error=str(e))
+            candidate = kundali.candidate
+            if not candidate or not candidate.resume_id:
+                continue
+            
+            # Prepare resume data
+            resume_data = {
+                "experience_years": kundali.total_experience_years or 0,
+                "experience": kundali.experience_data or [],
+                "projects": kundali.projects_data or [],
+                "education": kundali.education_data or [],
+                "skills": _flatten_skills((
+                    kundali.skills_frontend,
+                    kundali.skills_backend,
+                    kundali.skills_data,
+                    kundali.skills_devops,
+                    kundali.skills_ai_ml,
+                    kundali.skills_tools,
+                    kundali.skills_soft,
+                )),
+            }
+            raw_text = candidate.resume.raw_text if candidate.resume else ""
+            pending.append((kundali, resume_data, raw_text or ""))
+        
+        # The analyzer waits on Ollama over HTTP, so threads overlap those calls
+        with ThreadPoolExecutor(max_workers=ANALYZER_WORKERS) as executor:
+            analyses = list(executor.map(
+                lambda job: _analyze_seniority(job[0].candidate_id, job[1], job[2]), pending
+            ))
+        
+        # Per-candidate report lines are buffered and written once, not one write per row
+        report = []
+        payload = []
+        for (kundali, _, _), seniority_analysis in zip(pending, analyses):
+            if seniority_analysis is None:
                 # Set to mid as fallback
-                kundali.seniority_level = "mid"
-                kundali.seniority_confidence = 0.5
-                updated_count += 1
+                payload.append({"id": kundali.id, "seniority_level": "mid", "seniority_confidence": 0.5})
                 continue
+            
+            new_level = seniority_analysis.get("seniority_level", "mid")
+            if new_level == "unknown":
+                new_level = "mid"  # Never allow unknown
+            
+            payload.append({
+                "id": kundali.id,
+                "seniority_level": new_level,
+                "seniority_confidence": seniority_analysis.get("confidence", 0.7),
+                "seniority_evidence": seniority_analysis.get("evidence", []),
+            })
+            report.append(f"Updated candidate {kundali.candidate_id}: {kundali.name} -> {new_level}")
+        updated_count = len(payload)
         
+        # One bulk UPDATE by primary key instead of an ORM flush per kundali
+        if payload:
+            db.execute(update(CandidateKundali), payload)
         db.commit()
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
         print(f"\n✅ Successfully updated {updated_count} candidates")
         
     except Exception as e: